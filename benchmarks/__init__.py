@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+Quick & dirty benchmarks for the hot paths.  Run them from the repo root, e.g.
+
+    python -m benchmarks.schedule_page
+"""
+
+import os
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "saucerbot.settings")
+os.environ.setdefault("DJANGO_ENV", "test")
+
+import django  # noqa: E402
+
+django.setup()
+
+
+def bench(name: str, func: Callable[[], Any], number: int = 200) -> float:
+    """
+    Print (and return) the mean time & peak memory of a call to func
+    """
+    func()  # warm up
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    mean = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"{name:<40} {mean * 1000:8.3f} ms  {peak / 1024:8.1f} KiB peak")
+    return mean
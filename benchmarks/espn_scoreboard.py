@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Finding the Vandy game on a week's worth of FBS scoreboard
+"""
+
+import json
+
+from benchmarks import bench
+from saucerbot.utils.sports.espn import ESPNScoreboard, find_team_event
+from tests.factories import make_scoreboard_event
+
+EVENTS = 150
+
+
+def make_scoreboard() -> dict:
+    events = [
+        make_scoreboard_event(i, f"Home {i}", f"Away {i}") for i in range(EVENTS - 1)
+    ]
+    # Worst case, we're at the bottom of the board
+    events.append(make_scoreboard_event(EVENTS, "Vanderbilt", "Alabama"))
+    return {"events": events}
+
+
+def validate_everything(scoreboard: dict):
+    for event in ESPNScoreboard.model_validate(scoreboard).events:
+        for competitor in event.competitions[0].competitors:
+            if competitor.team.location == "Vanderbilt":
+                return event
+    return None
+
+
+def main():
+    raw = json.dumps(make_scoreboard())
+
+    assert validate_everything(json.loads(raw)) == find_team_event(
+        json.loads(raw), "Vanderbilt"
+    )
+
+    bench(
+        "ESPNScoreboard.model_validate",
+        lambda: validate_everything(json.loads(raw)),
+        number=20,
+    )
+    bench(
+        "find_team_event",
+        lambda: find_team_event(json.loads(raw), "Vanderbilt"),
+        number=20,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Scraping the Bridgestone listing & event pages with each Parser backend
+"""
+
+from benchmarks import bench
+from saucerbot.utils.parsers import (
+    BACKENDS,
+    BridgestoneEventsParser,
+    BridgestoneEventTimeParser,
+    HtmlContentProvider,
+    Page,
+)
+
+SAMPLES = [
+    (BridgestoneEventsParser, "test_resources/events-sample.html"),
+    (BridgestoneEventTimeParser, "test_resources/event-time-sample.html"),
+]
+
+
+class StaticContentProvider(HtmlContentProvider):
+    def __init__(self, html: str):
+        super().__init__("")
+        self.html = html
+
+    def get_page(self) -> Page:
+        # A fresh page every time so the html gets parsed too
+        return Page(self.html)
+
+
+def main():
+    for parser_class, path in SAMPLES:
+        with open(path, "r") as f:
+            html = f.read()
+
+        for backend in BACKENDS:
+            bench(
+                f"{parser_class.__name__} ({backend})",
+                lambda: list(
+                    parser_class(StaticContentProvider(html), backend=backend).parse()
+                ),
+                number=20,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+Reading the team schedule out of an ESPN schedule page
+"""
+
+import json
+
+from benchmarks import bench
+from saucerbot.utils.sports import schedule_page_utils
+from saucerbot.utils.sports.schedule_page_utils import read_schedule_events
+
+retrieve_team_schedule = getattr(schedule_page_utils, "__retrieve_team_schedule")
+
+SAMPLE_PAGE = "test_resources/sample_schedule_page.html"
+
+
+def full_page_parse(text: str) -> list[dict]:
+    # What we used to do: decode the page, then parse the whole page config
+    start = text.index("window['__espnfitt__']")
+    true_start = text.index("{", start)
+    end = text.index("</script>", start)
+    true_end = text.rindex("}", start, end)
+    data = json.loads(text[true_start : true_end + 1])
+    return data["page"]["content"]["scheduleData"]["teamSchedule"]
+
+
+def main():
+    with open(SAMPLE_PAGE, "rb") as f:
+        page = f.read()
+
+    bench("full page decode + json.loads", lambda: full_page_parse(page.decode()))
+    bench("team schedule extraction", lambda: retrieve_team_schedule(page))
+
+    # Including turning them into events
+    bench("read_schedule_events", lambda: read_schedule_events(page))
+
+
+if __name__ == "__main__":
+    main()
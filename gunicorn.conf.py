@@ -16,3 +16,10 @@ class GunicornLogger(Logger):
 
 
 logger_class = GunicornLogger
+
+
+def worker_exit(server, worker):
+    # Let any queued callback handlers finish before the worker goes away
+    from saucerbot.core.dispatch import callback_dispatcher
+
+    callback_dispatcher.shutdown()
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+import atexit
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+import rollbar
+from django.conf import settings
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFull(Exception):
+    pass
+
+
+class MeteredExecutor(ThreadPoolExecutor):
+    """
+    A thread pool that keeps track of how much work is waiting on it, so we can
+    tell when bursts are backing up.  With ``max_queue`` set, it refuses new work
+    (with QueueFull) once that many tasks are pending.
+    """
+
+    def __init__(
+        self, max_workers: int, thread_name_prefix: str, max_queue: int | None = None
+    ) -> None:
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.name = thread_name_prefix
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        The number of tasks that are queued or running
+        """
+        return self._pending
+
+    @property
+    def waiting(self) -> int:
+        """
+        The number of tasks that don't have a thread yet
+        """
+        return max(self._pending - self.max_workers, 0)
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        with self._lock:
+            if self.max_queue is not None and self._pending >= self.max_queue:
+                raise QueueFull(f"{self.name} has {self._pending} tasks pending")
+
+            # Raises RuntimeError if we've been shut down, before counting anything
+            future = super().submit(fn, *args, **kwargs)
+            self._pending += 1
+            depth = self._pending
+
+        if depth > self.max_workers:
+            logger.info(
+                "%s queue depth: %d (%d waiting)",
+                self.name,
+                depth,
+                depth - self.max_workers,
+            )
+        else:
+            logger.debug("%s queue depth: %d", self.name, depth)
+
+        future.add_done_callback(self._finished)
+        return future
+
+    def _finished(self, _: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+
+class BackgroundDispatcher:
+    """
+    Runs work (like message handlers) on a bounded pool of threads so a webhook can
+    respond right away.  Once ``max_queue`` tasks are pending, new work is refused
+    and the caller should just run it in the foreground.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: MeteredExecutor | None = None
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        The number of tasks that are queued or running
+        """
+        return self._executor.queue_depth if self._executor else 0
+
+    def _get_executor(self) -> MeteredExecutor:
+        if self._executor is None:
+            self._executor = MeteredExecutor(
+                self.max_workers, self.name, max_queue=self.max_queue
+            )
+        return self._executor
+
+    def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        # Worker threads don't get the request lifecycle, so manage connections here
+        close_old_connections()
+        try:
+            return func(*args)
+        except Exception:
+            # This is outside the request, so the rollbar middleware won't see it
+            logger.exception("Background task %s failed", func)
+            rollbar.report_exc_info()
+            raise
+        finally:
+            close_old_connections()
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> Future | None:
+        """
+        Queue up ``func(*args)``.  Returns None if the queue is full or we're
+        shutting down, in which case nothing was queued.
+        """
+        with self._lock:
+            if self._shutdown:
+                return None
+            executor = self._get_executor()
+
+        try:
+            return executor.submit(self._run, func, *args)
+        except QueueFull:
+            logger.warning(
+                "%s queue is full (%d tasks), refusing new work",
+                self.name,
+                executor.queue_depth,
+            )
+        except RuntimeError:
+            # We got shut down in the meantime (or the interpreter is exiting)
+            logger.warning("%s couldn't queue new work", self.name)
+        return None
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop taking new work, and (by default) wait for everything queued to finish
+        """
+        with self._lock:
+            self._shutdown = True
+            executor = self._executor
+
+        if executor:
+            logger.info("Draining %d %s tasks", executor.queue_depth, self.name)
+            executor.shutdown(wait=wait)
+
+
+callback_dispatcher = BackgroundDispatcher(
+    "callback-dispatch",
+    settings.CALLBACK_DISPATCH_WORKERS,
+    settings.CALLBACK_DISPATCH_QUEUE_SIZE,
+)
+
+# Finish up any in-flight messages when the worker exits
+atexit.register(callback_dispatcher.shutdown)
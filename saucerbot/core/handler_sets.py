@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+
+logger = logging.getLogger(__name__)
+
+
+class HandlerSetCache:
+    """
+    Caches the names of the handlers enabled for each bot / channel.  Handler
+    configuration changes a few times a month, but it's read for every message.
+
+    Entries go in the django cache named by ``HANDLER_SET_CACHE``, which every
+    worker (and the discord bot) has to share so they all see invalidations.
+    With no cache configured, nothing is cached and the handlers are loaded from
+    the database every time.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+
+    @property
+    def backend(self) -> BaseCache | None:
+        alias = settings.HANDLER_SET_CACHE
+        return caches[alias] if alias else None
+
+    @staticmethod
+    def _key(platform: str, key: str) -> str:
+        return f"handler-set:{platform}:{key}"
+
+    def get(self, platform: str, key: str) -> frozenset[str] | None:
+        backend = self.backend
+        if backend:
+            return backend.get(self._key(platform, key))
+        return None
+
+    def set(self, platform: str, key: str, names: Iterable[str]) -> frozenset[str]:
+        handler_names = frozenset(names)
+        backend = self.backend
+        if backend:
+            backend.set(self._key(platform, key), handler_names, self.ttl)
+        return handler_names
+
+    async def aget(self, platform: str, key: str) -> frozenset[str] | None:
+        backend = self.backend
+        if backend:
+            return await backend.aget(self._key(platform, key))
+        return None
+
+    async def aset(
+        self, platform: str, key: str, names: Iterable[str]
+    ) -> frozenset[str]:
+        handler_names = frozenset(names)
+        backend = self.backend
+        if backend:
+            await backend.aset(self._key(platform, key), handler_names, self.ttl)
+        return handler_names
+
+    def get_or_load(
+        self, platform: str, key: str, loader: Callable[[], Iterable[str]]
+    ) -> frozenset[str]:
+        handler_names = self.get(platform, key)
+        if handler_names is None:
+            handler_names = self.set(platform, key, loader())
+        return handler_names
+
+    async def aget_or_load(
+        self,
+        platform: str,
+        key: str,
+        loader: Callable[[], Awaitable[Iterable[str]]],
+    ) -> frozenset[str]:
+        handler_names = await self.aget(platform, key)
+        if handler_names is None:
+            handler_names = await self.aset(platform, key, await loader())
+        return handler_names
+
+    def invalidate(self, platform: str, key: str) -> None:
+        logger.debug("Invalidating %s handlers for %s", platform, key)
+        backend = self.backend
+        if backend:
+            backend.delete(self._key(platform, key))
+
+    async def ainvalidate(self, platform: str, key: str) -> None:
+        logger.debug("Invalidating %s handlers for %s", platform, key)
+        backend = self.backend
+        if backend:
+            await backend.adelete(self._key(platform, key))
+
+
+handler_sets = HandlerSetCache(settings.HANDLER_SET_TTL)
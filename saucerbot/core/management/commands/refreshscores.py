@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+import logging
+import time
+
+import arrow
+import requests
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import close_old_connections
+from lowerpines.exceptions import GroupMeApiException, NoneFoundException
+
+from saucerbot.core.models import GameResult
+from saucerbot.discord.utils import post_channel_message
+from saucerbot.groupme.models import Bot
+from saucerbot.utils.sports.models import VandyResult, get_latest_results
+from saucerbot.utils.the_dores import VANDY_TEAMS, build_message_response
+from saucerbot.utils.time_utils import CENTRAL_TIME
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Keeps the stored Vandy game results up to date"
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="Seconds between refreshes. Refreshes once and exits if not set.",
+        )
+        parser.add_argument(
+            "--bot",
+            action="append",
+            dest="bots",
+            default=[],
+            help="A GroupMe bot to post final scores as (can be repeated)",
+        )
+        parser.add_argument(
+            "--channel",
+            action="append",
+            dest="channels",
+            default=[],
+            help="A Discord channel ID to post final scores to (can be repeated)",
+        )
+
+    def handle(self, *args, **options) -> None:
+        while True:
+            if not options["interval"]:
+                self.refresh(options["bots"], options["channels"])
+                return
+
+            try:
+                self.refresh(options["bots"], options["channels"])
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Whatever went wrong, keep going, hopefully it works next time
+                logger.exception("Failed to refresh scores")
+
+            # Don't hang on to a connection while we sleep
+            close_old_connections()
+            time.sleep(options["interval"])
+
+    def refresh(self, bots: list[str], channels: list[str]) -> None:
+        today = arrow.now(CENTRAL_TIME)
+        teams = [team for team in VANDY_TEAMS if team.is_in_season(today)]
+
+        for team, result in zip(teams, get_latest_results(teams, today)):
+            if result is None:
+                continue
+
+            game, went_final = GameResult.objects.record(team.name, result)
+            logger.info("Refreshed %s", game)
+
+            if went_final:
+                self.post_final(result, bots, channels)
+
+    def post_final(
+        self, result: VandyResult, bots: list[str], channels: list[str]
+    ) -> None:
+        message = build_message_response([result])
+
+        for bot in Bot.objects.filter(slug__in=bots):
+            try:
+                bot.post_message(message)
+            except (GroupMeApiException, NoneFoundException, requests.RequestException):
+                logger.exception("Failed to post the final score as %s", bot.slug)
+
+        for channel_id in channels:
+            try:
+                post_channel_message(channel_id, message)
+            except requests.RequestException:
+                logger.exception("Failed to post the final score to %s", channel_id)
+
+        self.stdout.write(message)
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+import logging
+from typing import Any
+
+import arrow
+from django.core.management.base import BaseCommand
+
+from saucerbot.core.models import BridgestoneEvent
+from saucerbot.utils.bridgestone import (
+    bridgestone_events_url,
+    get_all_events,
+    get_event_times,
+)
+from saucerbot.utils.parsers import HtmlContentProvider
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Saves the Bridgestone events, only fetching event pages that changed"
+
+    def handle(self, *args, **options) -> None:
+        events = get_all_events(HtmlContentProvider(bridgestone_events_url))
+        if not events:
+            # More likely the page changed than every event got cancelled
+            logger.warning("No events found, leaving the stored events alone")
+            return
+
+        stored = {
+            event.details: event
+            for event in BridgestoneEvent.objects.filter(
+                details__in=[event["details"] for event in events]
+            )
+        }
+        changed = [
+            event
+            for event in events
+            if self.needs_refresh(stored.get(event["details"]), event)
+        ]
+
+        for event, event_time in zip(changed, get_event_times(changed)):
+            logger.info("Saving %s", event["name"])
+            BridgestoneEvent.objects.upsert(event, event_time)
+
+        # Anything still to come that's not listed any more got cancelled
+        removed, _ = (
+            BridgestoneEvent.objects.filter(date__gte=arrow.now("US/Central").date())
+            .exclude(details__in=[event["details"] for event in events])
+            .delete()
+        )
+
+        self.stdout.write(
+            f"Found {len(events)} events, {len(changed)} were new or changed, "
+            f"{removed} were removed"
+        )
+
+    @staticmethod
+    def needs_refresh(stored: BridgestoneEvent | None, event: dict[str, Any]) -> bool:
+        if stored is None or stored.time is None:
+            # New, or we couldn't find the time last time around
+            return True
+        return stored.content_hash != BridgestoneEvent.hash_event(event)
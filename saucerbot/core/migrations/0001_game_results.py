@@ -0,0 +1,37 @@
+# Generated by Django 5.1.15 on 2026-10-18 10:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="GameResult",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("team", models.CharField(max_length=64)),
+                ("date", models.DateField()),
+                ("opponent", models.CharField(max_length=128)),
+                ("vandy_score", models.IntegerField(null=True)),
+                ("opponent_score", models.IntegerField(null=True)),
+                ("is_finished", models.BooleanField(default=False)),
+                ("updated", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "unique_together": {("team", "date", "opponent")},
+            },
+        ),
+    ]
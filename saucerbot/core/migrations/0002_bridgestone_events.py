@@ -0,0 +1,33 @@
+# Generated by Django 5.1.15 on 2026-10-18 10:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_game_results"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BridgestoneEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("details", models.URLField(max_length=512, unique=True)),
+                ("name", models.CharField(max_length=256)),
+                ("date", models.DateField(db_index=True)),
+                ("time", models.CharField(max_length=16, null=True)),
+                ("content_hash", models.CharField(max_length=64)),
+                ("updated", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -1,14 +1,19 @@
 # -*- coding: utf-8 -*-
 
+import datetime
+import hashlib
 from abc import abstractmethod
-from collections.abc import Callable
-from typing import Type
+from collections.abc import Callable, Sequence
+from typing import Any, Type
 
 from django.contrib.auth import models as auth_models
 from django.core.exceptions import SuspiciousOperation
 from django.db import models
 from django.db.models.manager import EmptyManager
 from django.http import HttpRequest
+from django.utils import timezone
+
+from saucerbot.utils.sports.models import VandyResult
 
 
 class BaseUser(models.Model):
@@ -71,3 +76,131 @@ def get_user_builder(
         return None
 
     return get_user
+
+
+class GameResultManager(models.Manager["GameResult"]):
+    def record(self, team: str, result: VandyResult) -> tuple["GameResult", bool]:
+        """
+        Save the latest result for a team's game.  A game from today that we
+        see for the first time after it's over counts as just going final too.
+        :return: the game, and whether it just went final
+        """
+        was_finished = (
+            self.filter(team=team, date=result.date, opponent=result.opponent)
+            .values_list("is_finished", flat=True)
+            .first()
+        )
+        game, _ = self.update_or_create(
+            team=team,
+            date=result.date,
+            opponent=result.opponent,
+            defaults={
+                "vandy_score": result.vandy_score,
+                "opponent_score": result.opponent_score,
+                "is_finished": result.is_finished,
+            },
+        )
+        if was_finished is None:
+            # Never seen before, so only announce it if it's today's game
+            went_final = result.is_finished and result.date == timezone.localdate()
+        else:
+            went_final = result.is_finished and not was_finished
+        return game, went_final
+
+    def latest_results(
+        self, teams: Sequence[str], desired_date: datetime.date, days: int = 3
+    ) -> dict[str, VandyResult]:
+        """
+        The most recent result on or before the date for each team, going back
+        at most ``days`` days
+        """
+        games = self.filter(
+            team__in=teams,
+            date__lte=desired_date,
+            date__gt=desired_date - datetime.timedelta(days=days),
+        ).order_by("team", "-date")
+
+        results: dict[str, VandyResult] = {}
+        for game in games:
+            results.setdefault(game.team, game.to_result())
+        return results
+
+
+class GameResult(models.Model):
+    team = models.CharField(max_length=64)
+    date = models.DateField()
+    opponent = models.CharField(max_length=128)
+    vandy_score = models.IntegerField(null=True)
+    opponent_score = models.IntegerField(null=True)
+    is_finished = models.BooleanField(default=False)
+    updated = models.DateTimeField(auto_now=True)
+
+    objects = GameResultManager()
+
+    class Meta:
+        unique_together = [("team", "date", "opponent")]
+
+    def __str__(self):
+        return f"{self.team} vs {self.opponent} on {self.date}"
+
+    def to_result(self) -> VandyResult:
+        return VandyResult(
+            date=self.date,
+            is_finished=self.is_finished,
+            vandy_team=self.team,
+            vandy_score=self.vandy_score,
+            opponent=self.opponent,
+            opponent_score=self.opponent_score,
+        )
+
+
+class BridgestoneEventManager(models.Manager["BridgestoneEvent"]):
+    def upsert(
+        self, event: dict[str, Any], event_time: str | None
+    ) -> "BridgestoneEvent":
+        bridgestone_event, _ = self.update_or_create(
+            details=event["details"],
+            defaults={
+                "name": event["name"],
+                "date": event["parsed_date"],
+                "time": event_time,
+                "content_hash": BridgestoneEvent.hash_event(event),
+            },
+        )
+        return bridgestone_event
+
+    def on(self, date: datetime.date) -> list[dict[str, Any]]:
+        """
+        The events on a date, in the same shape the scraper gives them back
+        """
+        return [event.to_event() for event in self.filter(date=date).order_by("id")]
+
+
+class BridgestoneEvent(models.Model):
+    details = models.URLField(max_length=512, unique=True)
+    name = models.CharField(max_length=256)
+    date = models.DateField(db_index=True)
+    time = models.CharField(max_length=16, null=True)
+    content_hash = models.CharField(max_length=64)
+    updated = models.DateTimeField(auto_now=True)
+
+    objects = BridgestoneEventManager()
+
+    def __str__(self):
+        return f"{self.name} on {self.date}"
+
+    @staticmethod
+    def hash_event(event: dict[str, Any]) -> str:
+        """
+        Hash what the events listing says about an event, so we know when it changed
+        """
+        content = "\n".join([event["name"], event["date"] or ""])
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def to_event(self) -> dict[str, Any]:
+        return {
+            "details": self.details,
+            "name": self.name,
+            "parsed_date": self.date,
+            "time": self.time,
+        }
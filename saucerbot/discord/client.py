@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import logging
+from collections import defaultdict
 from typing import Any, TypeVar
 
 import arrow
@@ -15,12 +16,15 @@ from discord import (
     TextChannel,
     User,
 )
+from discord.abc import GuildChannel
 from discord.app_commands import CommandTree
 from django.utils import timezone
 
+from saucerbot.core.handler_sets import handler_sets
 from saucerbot.discord.models import Channel as SChannel
 from saucerbot.discord.models import Guild as SGuild
-from saucerbot.discord.models import HistoricalDisplayName
+from saucerbot.discord.models import Handler, HistoricalDisplayName
+from saucerbot.utils import http
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +41,11 @@ class SaucerbotClient(Client):
         self.tree = CommandTree(self)
         self.dev_guild_id: str | None = options.pop("dev_guild_id", None)
 
+        # Stored guilds & channels by their discord id, so messages don't have to
+        # look them up every time
+        self.stored_guilds: dict[int, SGuild] = {}
+        self.stored_channels: dict[int, SChannel] = {}
+
     async def setup_hook(self):
         if self.dev_guild_id:
             guild = Object(id=self.dev_guild_id)
@@ -45,30 +54,108 @@ class SaucerbotClient(Client):
             self.tree.copy_global_to(guild=guild)
             await self.tree.sync(guild=guild)
 
+    async def close(self):
+        # Don't leave our own pooled connections open either
+        await http.aclose()
+        await super().close()
+
     async def on_ready(self):
         logger.info("Logged in as %s", self.user)
 
-    async def lookup_guild(self, guild: Guild) -> SGuild:
-        s_guild, _ = await SGuild.objects.aget_or_create(  # type: ignore
-            guild_id=guild.id,
-            defaults={
-                "name": guild.name,
-            },
+    async def on_guild_available(self, guild: Guild):
+        # Sent for every guild before on_ready, and again after any outage
+        await self.load_guild(guild)
+
+    async def load_guild(self, guild: Guild) -> None:
+        """
+        Load everything we have stored for a guild: its channels, and the
+        handlers enabled in each of them
+        """
+        s_guild = await self.lookup_guild(guild)
+
+        handler_names: dict[str, set[str]] = defaultdict(set)
+        async for channel in SChannel.objects.filter(guild=s_guild):  # type: ignore
+            channel.guild = s_guild
+            self.stored_channels[int(channel.channel_id)] = channel
+            handler_names[channel.channel_id] = set()
+
+        enabled = Handler.objects.filter(channel__guild=s_guild).values_list(
+            "channel__channel_id", "handler_name"
         )
+        async for channel_id, handler_name in enabled:  # type: ignore
+            handler_names[channel_id].add(handler_name)
+
+        for channel_id, names in handler_names.items():
+            await handler_sets.aset("discord", channel_id, names)
+
+        logger.info("Loaded %d channels for %s", len(handler_names), guild)
+
+    async def lookup_guild(self, guild: Guild) -> SGuild:
+        s_guild = self.stored_guilds.get(guild.id)
+        if s_guild is None:
+            s_guild, _ = await SGuild.objects.aget_or_create(  # type: ignore
+                guild_id=guild.id,
+                defaults={
+                    "name": guild.name,
+                },
+            )
+            self.stored_guilds[guild.id] = s_guild
         return s_guild
 
-    async def lookup_channel(self, guild: SGuild, channel: TextChannel) -> SChannel:
-        s_channel, created = await SChannel.objects.aget_or_create(  # type: ignore
-            guild=guild,
-            channel_id=channel.id,
-            defaults={
-                "name": channel.name,
-            },
+    async def lookup_channel(self, channel: TextChannel) -> SChannel:
+        s_channel = self.stored_channels.get(channel.id)
+
+        # Deleting a channel (or changing its handlers) clears its handler set, so
+        # only trust the stored channel while that's still cached
+        if s_channel is not None:
+            if await handler_sets.aget("discord", s_channel.channel_id) is not None:
+                return s_channel
+
+        s_channel = (
+            await SChannel.objects.select_related("guild")  # type: ignore
+            .filter(channel_id=channel.id)
+            .afirst()
         )
-        if created:
+        if s_channel is None:
+            # The guild might have been deleted too, don't trust the stored one
+            self.stored_guilds.pop(channel.guild.id, None)
+            s_guild = await self.lookup_guild(channel.guild)
+            s_channel = await SChannel.objects.acreate(  # type: ignore
+                guild=s_guild,
+                channel_id=channel.id,
+                name=channel.name,
+            )
             await s_channel.add_defaults()
+        else:
+            self.stored_guilds[channel.guild.id] = s_channel.guild
+        self.stored_channels[channel.id] = s_channel
         return s_channel
 
+    async def on_guild_update(self, _before: Guild, after: Guild):
+        s_guild = self.stored_guilds.get(after.id)
+        if s_guild and s_guild.name != after.name:
+            s_guild.name = after.name
+            await s_guild.asave(update_fields=["name"])
+
+    async def on_guild_remove(self, guild: Guild):
+        self.stored_guilds.pop(guild.id, None)
+        for channel in guild.channels:
+            self.stored_channels.pop(channel.id, None)
+
+    async def on_guild_channel_create(self, channel: GuildChannel):
+        if isinstance(channel, TextChannel):
+            await self.lookup_channel(channel)
+
+    async def on_guild_channel_update(self, _before: GuildChannel, after: GuildChannel):
+        s_channel = self.stored_channels.get(after.id)
+        if s_channel and s_channel.name != after.name:
+            s_channel.name = after.name
+            await s_channel.asave(update_fields=["name"])
+
+    async def on_guild_channel_delete(self, channel: GuildChannel):
+        # Keep the stored channel around, just stop holding on to it
+        self.stored_channels.pop(channel.id, None)
+
     async def on_message(self, message: Message):
         logger.info(
             "Message from %s in %s#%s: %s",
@@ -81,13 +168,9 @@ class SaucerbotClient(Client):
         if message.author == self.user:
             return
 
-        if message.guild:
-            stored_guild = await self.lookup_guild(message.guild)
-            if isinstance(message.channel, TextChannel):
-                stored_channel = await self.lookup_channel(
-                    stored_guild, message.channel
-                )
-                await stored_channel.handle_message(self.loop, message)
+        if message.guild and isinstance(message.channel, TextChannel):
+            stored_channel = await self.lookup_channel(message.channel)
+            await stored_channel.handle_message(self.loop, message)
 
     async def on_reaction_add(self, reaction: Reaction, user: User | Member):
         logger.info("%s reacted to %s with %s", user, reaction.message, reaction)
@@ -123,9 +206,6 @@ class SaucerbotClient(Client):
     # async def on_user_update(self, before: User, after: User):
     #     pass
     #
-    # async def on_guild_available(self, guild: Guild):
-    #     pass
-    #
     # async def on_guild_unavailable(self, guild: Guild):
     #     pass
     #
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import asyncio
+import concurrent.futures
 import logging
 from datetime import timedelta
 from typing import Any
@@ -14,9 +15,12 @@ from discord.abc import Messageable
 from discord.errors import HTTPException
 from discord.types import user
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
 from django.utils.functional import cached_property
 
+from saucerbot.core.handler_sets import handler_sets
 from saucerbot.core.models import BaseUser, InvalidUser, get_user_builder
 from saucerbot.discord.http import SaucerbotDiscordHTTPClient
 from saucerbot.discord.utils import get_new_token
@@ -27,11 +31,11 @@ logger = logging.getLogger(__name__)
 SESSION_KEY = "_discord_user_id"
 
 
-def _sending_done_callback(fut: asyncio.Future):
+def _sending_done_callback(fut: asyncio.Future | concurrent.futures.Future):
     # just retrieve any exception and call it a day
     try:
         fut.exception()
-    except asyncio.CancelledError:
+    except (asyncio.CancelledError, concurrent.futures.CancelledError):
         pass
 
 
@@ -41,7 +45,19 @@ class DiscordBotContext(BotContext):
         self.messageable = messageable
 
     def post(self, message: Any):
-        task = asyncio.ensure_future(self.messageable.send(message), loop=self.loop)
+        coro = self.messageable.send(message)
+
+        try:
+            on_loop = asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            on_loop = False
+
+        task: asyncio.Future | concurrent.futures.Future
+        if on_loop:
+            task = asyncio.ensure_future(coro, loop=self.loop)
+        else:
+            # Sync handlers get run off the event loop, so hand it back safely
+            task = asyncio.run_coroutine_threadsafe(coro, self.loop)
         task.add_done_callback(_sending_done_callback)
 
 
@@ -167,17 +183,26 @@ class Channel(models.Model):
     async def handle_message(
         self, loop: asyncio.AbstractEventLoop, message: DMessage
     ) -> list[str]:
-        handler_names = await loop.run_in_executor(
-            None, lambda: {h.handler_name for h in self.handlers.all()}
+        handler_names = await handler_sets.aget_or_load(
+            "discord", self.channel_id, self.load_handler_names
         )
 
-        return registry.handle_message(
+        return await registry.handle_message_async(
             "discord",
             handler_names,
             DiscordBotContext(loop, message.channel),
             DiscordMessage(message),
         )
 
+    async def load_handler_names(self) -> list[str]:
+        # Straight from the async ORM, rather than tying up an executor thread
+        return [
+            name
+            async for name in self.handlers.values_list(  # type: ignore
+                "handler_name", flat=True
+            )
+        ]
+
     async def add_defaults(self):
         default_handlers = [
             Handler(channel=self, handler_name=h.name)
@@ -186,6 +211,9 @@ class Channel(models.Model):
         ]
         await self.handlers.abulk_create(default_handlers)
 
+        # bulk_create doesn't send any signals
+        await handler_sets.ainvalidate("discord", self.channel_id)
+
 
 class Handler(models.Model):
     channel = models.ForeignKey(Channel, models.CASCADE, related_name="handlers")
@@ -198,6 +226,20 @@ class Handler(models.Model):
         return f"Handler({self.channel_id}, {self.handler_name})"
 
 
+@receiver([post_save, post_delete], sender=Channel)
+def invalidate_channel_handlers(instance: Channel, **kwargs):
+    handler_sets.invalidate("discord", instance.channel_id)
+
+
+@receiver([post_save, post_delete], sender=Handler)
+def invalidate_handlers(instance: Handler, **kwargs):
+    try:
+        handler_sets.invalidate("discord", instance.channel.channel_id)
+    except Channel.DoesNotExist:
+        # The channel is going away too, it'll invalidate itself
+        pass
+
+
 class HistoricalDisplayName(models.Model):
     guild_id = models.CharField(max_length=64)
     user_id = models.CharField(max_length=64)
@@ -7,6 +7,7 @@ from rest_framework import serializers
 from rest_framework.request import Request
 from rest_framework.reverse import reverse
 
+from saucerbot.core.handler_sets import handler_sets
 from saucerbot.core.serializers import HandlerRelatedField
 from saucerbot.discord.models import Channel, Guild, Handler
 
@@ -85,4 +86,7 @@ class ChannelSerializer(serializers.HyperlinkedModelSerializer):
 
             Handler.objects.bulk_create(handler_objects)
 
+            # bulk_create doesn't send any signals
+            handler_sets.invalidate("discord", channel.channel_id)
+
         return channel
@@ -2,10 +2,11 @@
 
 from typing import Any
 
-import requests
 from django.conf import settings
 from django.urls import reverse
 
+from saucerbot.utils import http
+
 API_ENDPOINT = "https://discord.com/api/v8"
 
 
@@ -19,7 +20,7 @@ def _token_request(**kwargs) -> dict[str, Any]:
     data["client_secret"] = settings.DISCORD_CLIENT_SECRET
 
     headers = {"Content-Type": "application/x-www-form-urlencoded"}
-    r = requests.post(f"{API_ENDPOINT}/oauth2/token", data=data, headers=headers)
+    r = http.post(f"{API_ENDPOINT}/oauth2/token", data=data, headers=headers)
     r.raise_for_status()
     return r.json()
 
@@ -37,3 +38,16 @@ def get_new_token(refresh_token: str) -> dict[str, Any]:
         grant_type="refresh_token",
         refresh_token=refresh_token,
     )
+
+
+def post_channel_message(channel_id: str, content: str) -> None:
+    """
+    Post to a channel as the bot, for when we're not running inside the client
+    """
+    headers = {"Authorization": f"Bot {settings.DISCORD_BOT_TOKEN}"}
+    r = http.post(
+        f"{API_ENDPOINT}/channels/{channel_id}/messages",
+        json={"content": content},
+        headers=headers,
+    )
+    r.raise_for_status()
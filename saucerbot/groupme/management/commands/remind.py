@@ -9,7 +9,7 @@ from lowerpines.endpoints.message import Message
 from lowerpines.message import ComplexMessage, RefAttach
 
 from saucerbot.groupme.models import Bot
-from saucerbot.utils.bridgestone import create_message, get_todays_events
+from saucerbot.utils.bridgestone import create_message, get_todays_events_with_times
 
 logger = logging.getLogger(__name__)
 
@@ -71,9 +71,9 @@ class Command(BaseCommand):
         self.bot.post_message(LIKE_IF_POST)
         logger.info("Successfully sent reminder message.")
 
-        todays_events = get_todays_events()
-        if todays_events:
-            self.bot.post_message(create_message(todays_events[0]))
+        # Every event's time gets looked up at once, so warn about all of them
+        for event in get_todays_events_with_times():
+            self.bot.post_message(create_message(event))
 
     def whos_coming(self) -> None:
         """
@@ -7,6 +7,9 @@ from typing import Any
 import arrow
 from django.conf import settings
 from django.db import models
+from django.db.models import F, Subquery
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.urls import reverse
 from django.utils.functional import cached_property
 from django.utils.text import slugify
@@ -18,13 +21,19 @@ from lowerpines.exceptions import UnauthorizedException
 from lowerpines.gmi import GMI
 from lowerpines.message import ComplexMessage
 
+from saucerbot.core.handler_sets import handler_sets
 from saucerbot.core.models import BaseUser, InvalidUser, get_user_builder
 from saucerbot.handlers import BotContext, Message, registry
+from saucerbot.utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 SESSION_KEY = "_groupme_user_id"
 
+# Looking up a bot means listing every bot the owner has, so hang on to them
+groupme_bots: TTLCache[str, LPBot] = TTLCache(settings.GROUPME_OBJECT_TTL)
+groupme_groups: TTLCache[str, LPGroup] = TTLCache(settings.GROUPME_OBJECT_TTL)
+
 
 @lru_cache()
 def get_gmi(access_token: str) -> GMI:
@@ -111,7 +120,7 @@ def _callback_url(slug: str) -> str:
     return f"https://{settings.SERVER_DOMAIN}{path}"
 
 
-class BotManager(models.Manager):
+class BotManager(models.Manager["Bot"]):
     def create(self, **kwargs):
         owner = kwargs.get("owner")
         name = kwargs.get("name")
@@ -132,6 +141,46 @@ class BotManager(models.Manager):
 
         return super().create(**kwargs)
 
+    def resolve_webhook(self, slug: str) -> "Bot":
+        """
+        Load a bot for a webhook callback in one query, along with its enabled
+        handler names and the names of every bot in its group
+        """
+        group_id = self.filter(slug=slug).values("group_id")[:1]
+        rows: models.QuerySet[Bot] = self.filter(
+            group_id=Subquery(group_id)
+        ).select_related("owner")
+
+        handler_names = handler_sets.get("groupme", slug)
+        if handler_names is None:
+            rows = rows.annotate(enabled_handler=F("handlers__handler_name"))
+
+        bot: Bot | None = None
+        bot_names: set[str] = set()
+        loaded_names: set[str] = set()
+
+        # There's one row per bot in the group (or per (bot, handler) if we
+        # need to load the handlers too)
+        for row in rows:
+            bot_names.add(row.name)
+            if row.slug == slug:
+                bot = bot or row
+                enabled_handler: str | None = getattr(row, "enabled_handler", None)
+                if enabled_handler:
+                    loaded_names.add(enabled_handler)
+
+        if bot is None:
+            raise self.model.DoesNotExist(f"No bot found with slug '{slug}'")
+
+        if handler_names is None:
+            handler_names = handler_sets.set("groupme", slug, loaded_names)
+
+        # Pre-populate the cached properties so handle_message doesn't query again
+        bot.__dict__["handler_names"] = handler_names
+        bot.__dict__["group_bot_names"] = bot_names
+
+        return bot
+
 
 class Bot(models.Model):
     owner = models.ForeignKey(User, models.CASCADE, related_name="bots")
@@ -150,29 +199,54 @@ class Bot(models.Model):
 
     @cached_property
     def bot(self) -> LPBot:
-        return self.owner.gmi.bots.get(bot_id=self.bot_id)  # pylint: disable=no-member
+        return groupme_bots.get_or_set(
+            self.bot_id,
+            lambda: self.owner.gmi.bots.get(  # pylint: disable=no-member
+                bot_id=self.bot_id
+            ),
+        )
 
     @cached_property
     def group(self) -> LPGroup:
-        return self.owner.gmi.groups.get(
-            group_id=self.group_id
-        )  # pylint: disable=no-member
+        return groupme_groups.get_or_set(
+            self.group_id,
+            lambda: self.owner.gmi.groups.get(  # pylint: disable=no-member
+                group_id=self.group_id
+            ),
+        )
+
+    def clear_groupme_objects(self) -> None:
+        """
+        Forget the cached GroupMe bot & group, so they're looked up again next time
+        """
+        groupme_bots.delete(self.bot_id)
+        groupme_groups.delete(self.group_id)
+        self.__dict__.pop("bot", None)
+        self.__dict__.pop("group", None)
+
+    @cached_property
+    def handler_names(self) -> frozenset[str]:
+        return handler_sets.get_or_load(
+            "groupme",
+            self.slug,
+            lambda: (h.handler_name for h in self.handlers.all()),
+        )
+
+    @cached_property
+    def group_bot_names(self) -> set[str]:
+        return {b.name for b in Bot.objects.filter(group_id=self.group_id)}
 
     def post_message(self, message: ComplexMessage | str) -> None:
         self.bot.post(message)
 
     def handle_message(self, message: LPMessage) -> list[str]:
-        other_bot_names = [b.name for b in Bot.objects.filter(group_id=self.group_id)]
-
         # We don't want to respond to any other bot in the same group
-        if message.sender_type == "bot" and message.name in other_bot_names:
+        if message.sender_type == "bot" and message.name in self.group_bot_names:
             return []
 
-        handler_names = {h.handler_name for h in self.handlers.all()}
-
         matched_handlers = registry.handle_message(
             "groupme",
-            handler_names,
+            self.handler_names,
             GroupMeBotContext(self.bot),
             GroupMeMessage(message),
         )
@@ -184,6 +258,7 @@ class Bot(models.Model):
         self.bot.callback_url = _callback_url(self.slug)
         self.bot.avatar_url = avatar_url
         self.bot.save()
+        self.clear_groupme_objects()
 
 
 class Handler(models.Model):
@@ -197,6 +272,20 @@ class Handler(models.Model):
         return f"Handler({self.bot_id}, {self.handler_name})"
 
 
+@receiver([post_save, post_delete], sender=Bot)
+def invalidate_bot_handlers(instance: Bot, **kwargs):
+    handler_sets.invalidate("groupme", instance.slug)
+
+
+@receiver([post_save, post_delete], sender=Handler)
+def invalidate_handlers(instance: Handler, **kwargs):
+    try:
+        handler_sets.invalidate("groupme", instance.bot.slug)
+    except Bot.DoesNotExist:
+        # The bot is going away too, it'll invalidate itself
+        pass
+
+
 class SaucerUser(models.Model):
     groupme_id = models.CharField(max_length=32, unique=True)
     saucer_id = models.CharField(max_length=32)
@@ -7,6 +7,7 @@ from lowerpines.endpoints.group import Group
 from lowerpines.exceptions import NoneFoundException
 from rest_framework import serializers
 
+from saucerbot.core.handler_sets import handler_sets
 from saucerbot.core.serializers import HandlerRelatedField
 from saucerbot.groupme.models import Bot, Handler, User
 
@@ -62,6 +63,9 @@ class BotSerializer(serializers.HyperlinkedModelSerializer):
 
         Handler.objects.bulk_create(handler_objects)
 
+        # bulk_create doesn't send any signals
+        handler_sets.invalidate("groupme", bot.slug)
+
         return bot
 
     def validate_group(self, group: Group):
@@ -97,4 +101,7 @@ class BotSerializer(serializers.HyperlinkedModelSerializer):
 
             Handler.objects.bulk_create(handler_objects)
 
+            # bulk_create doesn't send any signals
+            handler_sets.invalidate("groupme", bot.slug)
+
         return bot
@@ -5,6 +5,7 @@ import logging
 from typing import Any
 
 from django.conf import settings
+from django.http import Http404
 from django.urls import reverse
 from django.views.generic import RedirectView
 from lowerpines.endpoints.message import Message
@@ -16,6 +17,7 @@ from rest_framework.response import Response
 from rest_framework.serializers import BaseSerializer
 from rest_framework.viewsets import GenericViewSet, ModelViewSet
 
+from saucerbot.core.dispatch import callback_dispatcher
 from saucerbot.core.models import InvalidUser
 from saucerbot.groupme.authentication import GroupMeUserAuthentication
 from saucerbot.groupme.models import SESSION_KEY, Bot, new_user
@@ -70,6 +72,7 @@ class BotViewSet(ModelViewSet):
         # Delete the bot from groupme first, then delete ours in the database
         if instance.bot:
             instance.bot.delete()
+        instance.clear_groupme_objects()
         instance.delete()
 
 
@@ -80,6 +83,17 @@ class BotActionsViewSet(GenericViewSet):
     lookup_value_type = "slug"
     permission_classes = [AllowAny]
 
+    def get_object(self) -> Bot:
+        slug = self.kwargs[self.lookup_field]
+
+        try:
+            bot = Bot.objects.resolve_webhook(slug)
+        except Bot.DoesNotExist as e:
+            raise Http404(f"No bot found with slug '{slug}'") from e
+
+        self.check_object_permissions(self.request, bot)
+        return bot
+
     def parse_as_message(self, bot: Bot) -> Message:
         if logger.isEnabledFor(logging.INFO):
             raw_json = json.dumps(self.request.data, ensure_ascii=False)
@@ -99,6 +113,10 @@ class BotActionsViewSet(GenericViewSet):
         if not message:
             raise ParseError("Invalid GroupMe message")
 
+        if settings.GROUPME_ASYNC_CALLBACKS:
+            if callback_dispatcher.submit(bot.handle_message, message):
+                return Response({"queued": True})
+
         response = {
             "matched_handlers": bot.handle_message(message),
         }
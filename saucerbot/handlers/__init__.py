@@ -1,19 +1,30 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
 import inspect
 import logging
 import re
 from abc import ABCMeta, abstractmethod
+from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Executor
+from functools import lru_cache
 from importlib import import_module
 from typing import Any, NamedTuple
 
 from arrow import Arrow
+from asgiref.sync import async_to_sync
+from django.conf import settings
+
+from saucerbot.core.dispatch import MeteredExecutor
 
 logger = logging.getLogger(__name__)
 
 VALID_PLATFORMS = {"discord", "groupme"}
 
+# How many distinct (platform, enabled handlers) combinations to keep plans for
+DISPATCH_PLAN_CACHE_SIZE = 256
+
 
 class BotContext(metaclass=ABCMeta):
     @abstractmethod
@@ -46,6 +57,63 @@ class Message(metaclass=ABCMeta):
         raise NotImplementedError
 
 
+Invoker = Callable[[BotContext, Message, re.Match[str] | None], Any]
+
+
+def build_invoker(func: Callable, is_regex: bool) -> Invoker:
+    """
+    Figure out how to call a handler function once, up front, so we don't have
+    to inspect its signature every time it matches
+    """
+    # Every invoker takes the same arguments, whether it uses them or not
+    # pylint: disable=unused-argument
+    invoker: Invoker
+
+    def invoke_plain(context, message, match):
+        return func(context, message)
+
+    def invoke_with_message_and_match(context, message, match):
+        return func(context, message=message, match=match)
+
+    def invoke_with_message(context, message, match):
+        return func(context, message=message)
+
+    def invoke_with_match(context, message, match):
+        return func(context, match=match)
+
+    def invoke_context_only(context, message, match):
+        return func(context)
+
+    if not is_regex:
+        # Plain handlers always get the context and the message
+        invoker = invoke_plain
+    else:
+        # Regex handlers only get the message and the match if they ask for them
+        params = inspect.signature(func).parameters
+        pass_message = "message" in params
+        pass_match = "match" in params
+
+        if pass_message and pass_match:
+            invoker = invoke_with_message_and_match
+        elif pass_message:
+            invoker = invoke_with_message
+        elif pass_match:
+            invoker = invoke_with_match
+        else:
+            invoker = invoke_context_only
+
+    if inspect.iscoroutinefunction(func):
+        # Keep it marked as a coroutine function so it can go through async_to_sync
+        sync_invoker = invoker
+
+        async def invoke_coroutine(context, message, match):
+            return await sync_invoker(context, message, match)
+
+        invoker = invoke_coroutine
+
+    return invoker
+
+
 class Handler(NamedTuple):
     name: str
     regexes: list[re.Pattern[str]] | None
@@ -53,6 +121,8 @@ class Handler(NamedTuple):
     func: Callable
     on_by_default: bool
     always_run: bool
+    invoke: Invoker
+    is_coroutine: bool
 
     @property
     def description(self):
@@ -65,6 +135,37 @@ class Handler(NamedTuple):
             ret += f" - {self.description}"
         return ret
 
+    def search(self, message: Message) -> re.Match[str] | None:
+        for regex in self.regexes or []:
+            match = regex.search(message.content)
+            if match:
+                return match
+        return None
+
+    def call(
+        self, context: BotContext, message: Message, match: re.Match[str] | None
+    ) -> Any:
+        if self.is_coroutine:
+            # We're on a sync path, so run it in an event loop
+            return async_to_sync(self.invoke)(context, message, match)
+        return self.invoke(context, message, match)
+
+    async def acall(
+        self,
+        context: BotContext,
+        message: Message,
+        match: re.Match[str] | None,
+        executor: Executor | None = None,
+    ) -> Any:
+        if self.is_coroutine:
+            return await self.invoke(context, message, match)
+
+        # Don't block the event loop with a sync handler
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, self.invoke, context, message, match
+        )
+
     def handle_regexes(
         self, context: BotContext, message: Message, regexes: list[re.Pattern]
     ) -> bool:
@@ -72,17 +173,7 @@ class Handler(NamedTuple):
             match = regex.search(message.content)
             if match:
                 # We matched!  Now call our handler and break out of the loop
-
-                # We want to see what arguments our function takes, though.
-                sig = inspect.signature(self.func)
-
-                kwargs: dict[str, Any] = {}
-                if "message" in sig.parameters:
-                    kwargs["message"] = message
-                if "match" in sig.parameters:
-                    kwargs["match"] = match
-
-                self.func(context, **kwargs)
+                self.call(context, message, match)
                 return True
 
         # Nothing matched
@@ -95,7 +186,86 @@ class Handler(NamedTuple):
         else:
             # Just a plain handler.
             # If it returns something truthy, it matched, so it means we should stop
-            return self.func(context, message)
+            return self.call(context, message, None)
+
+    async def run_async(
+        self, context: BotContext, message: Message, executor: Executor | None = None
+    ) -> bool:
+        if self.regexes:
+            match = self.search(message)
+            if not match:
+                return False
+            await self.acall(context, message, match, executor)
+            return True
+        else:
+            return await self.acall(context, message, None, executor)
+
+
+class DispatchIndex:
+    """
+    A set of regex handlers folded into one alternation per set of regex flags,
+    so a single scan of a message rules out every regex handler at once.
+    """
+
+    def __init__(self, handlers: Iterable[Handler]):
+        # Handlers we can't fold into a combined pattern, these are always checked
+        self.unindexed: set[str] = set()
+        self.scanners: list[tuple[re.Pattern[str], set[str]]] = []
+
+        alternatives: dict[int, list[str]] = defaultdict(list)
+        bucket_names: dict[int, set[str]] = defaultdict(set)
+
+        for handler in handlers:
+            if not handler.regexes:
+                continue
+
+            flags = {r.flags for r in handler.regexes}
+
+            # Capturing groups would renumber any backreferences once combined
+            if len(flags) > 1 or any(r.groups for r in handler.regexes):
+                self.unindexed.add(handler.name)
+                continue
+
+            flag = flags.pop()
+            alternative = "|".join(f"(?:{r.pattern})" for r in handler.regexes)
+
+            try:
+                re.compile(alternative, flag)
+            except re.error:
+                # Probably a global inline flag that can't be embedded
+                self.unindexed.add(handler.name)
+                continue
+
+            alternatives[flag].append(alternative)
+            bucket_names[flag].add(handler.name)
+
+        for flag, patterns in alternatives.items():
+            self.scanners.append(
+                (re.compile("|".join(patterns), flag), bucket_names[flag])
+            )
+
+    def candidates(self, content: str) -> set[str]:
+        """
+        Get the names of the regex handlers that may match the given content
+        """
+        names = set(self.unindexed)
+
+        for scanner, bucket in self.scanners:
+            # We only learn about the leftmost match, so anything in the bucket
+            # could still match.  The handlers re-check their own regexes.
+            if scanner.search(content):
+                names.update(bucket)
+
+        return names
+
+
+class DispatchPlan(NamedTuple):
+    """
+    The handlers enabled for a given platform & set of handler names, in order
+    """
+
+    handlers: list[Handler]
+    regex_index: DispatchIndex
 
 
 class HandlerRegistry(Sequence[Handler]):
@@ -106,6 +276,17 @@ class HandlerRegistry(Sequence[Handler]):
     ):
         self.handlers: list[Handler] = handlers or []
         self._loaded_modules: set[str] = loaded_modules or set()
+        self._by_name: dict[str, Handler] = {}
+        self._filtered: dict[str, HandlerRegistry] = {}
+        self._executor: MeteredExecutor | None = None
+
+        for handler in self.handlers:
+            self._by_name.setdefault(handler.name, handler)
+
+        # Bound per instance so each registry gets its own cache
+        self.dispatch_plan = lru_cache(maxsize=DISPATCH_PLAN_CACHE_SIZE)(
+            self._build_dispatch_plan
+        )
 
     # Sequence methods that just delegate to the underlying list
     def __getitem__(self, item):
@@ -144,6 +325,8 @@ class HandlerRegistry(Sequence[Handler]):
 
         total_handlers = len(self)
 
+        self._invalidate()
+
         logger.info(
             "Loaded %s new handlers, %s handlers total",
             total_handlers - initial_handler_count,
@@ -152,11 +335,21 @@ class HandlerRegistry(Sequence[Handler]):
 
     # filter method to only get handlers for a specific platform
     def filter(self, platform: str) -> "HandlerRegistry":
-        filtered = [h for h in self.handlers if platform in h.platforms]
-        return HandlerRegistry(filtered, self._loaded_modules)
+        filtered = self._filtered.get(platform)
+        if filtered is None:
+            filtered = HandlerRegistry(
+                [h for h in self.handlers if platform in h.platforms],
+                self._loaded_modules,
+            )
+            self._filtered[platform] = filtered
+        return filtered
 
     # get() method to make this look like a django queryset
     def get(self, **kwargs) -> Handler | None:
+        if kwargs.keys() == {"name"}:
+            # By far the most common lookup
+            return self._by_name.get(kwargs["name"])
+
         for handler in self.handlers:
             match = True
             for k, v in kwargs.items():
@@ -169,6 +362,33 @@ class HandlerRegistry(Sequence[Handler]):
 
         return None
 
+    def _build_dispatch_plan(
+        self, platform: str, handler_names: frozenset[str]
+    ) -> DispatchPlan:
+        handlers = [
+            h
+            for h in self.handlers
+            if platform in h.platforms and h.name in handler_names
+        ]
+        return DispatchPlan(handlers, DispatchIndex(handlers))
+
+    @property
+    def executor(self) -> MeteredExecutor:
+        """
+        The bounded pool sync handlers (and whatever ORM work they do) get
+        offloaded to from handle_message_async
+        """
+        if self._executor is None:
+            self._executor = MeteredExecutor(
+                max_workers=settings.HANDLER_EXECUTOR_WORKERS,
+                thread_name_prefix="handlers",
+            )
+        return self._executor
+
+    def _invalidate(self) -> None:
+        self._filtered.clear()
+        self.dispatch_plan.cache_clear()
+
     def handler(
         self,
         regex: str | list[str] | None = None,
@@ -200,16 +420,19 @@ class HandlerRegistry(Sequence[Handler]):
             if not case_sensitive:
                 flags = flags | re.IGNORECASE
 
-            self.handlers.append(
-                Handler(
-                    name or func.__name__,
-                    [re.compile(r, flags) for r in regexes],
-                    set(platforms or VALID_PLATFORMS),
-                    func,
-                    on_by_default,
-                    always_run,
-                )
+            handler = Handler(
+                name or func.__name__,
+                [re.compile(r, flags) for r in regexes],
+                set(platforms or VALID_PLATFORMS),
+                func,
+                on_by_default,
+                always_run,
+                build_invoker(func, bool(regexes)),
+                inspect.iscoroutinefunction(func),
             )
+            self.handlers.append(handler)
+            self._by_name.setdefault(handler.name, handler)
+            self._invalidate()
             return func
 
         return wrapper
@@ -217,26 +440,64 @@ class HandlerRegistry(Sequence[Handler]):
     def handle_message(
         self,
         platform: str,
-        handler_names: set[str],
+        handler_names: Iterable[str],
         context: BotContext,
         message: Message,
     ) -> list[str]:
         matched_handlers: list[str] = []
 
-        for handler in self:
-            if platform not in handler.platforms:
+        plan = self.dispatch_plan(platform, frozenset(handler_names))
+
+        # One scan to figure out which regex handlers are even worth trying
+        candidates = plan.regex_index.candidates(message.content)
+
+        for handler in plan.handlers:
+            # We already matched at least one handler, don't run this one
+            if matched_handlers and not handler.always_run:
                 continue
 
-            if handler.name not in handler_names:
+            if handler.regexes and handler.name not in candidates:
                 continue
 
+            logger.debug("Trying message handler %s ...", handler.name)
+
+            matched = handler.run(context, message)
+
+            # Keep track of the handlers that matched
+            if matched:
+                matched_handlers.append(handler.name)
+
+        return matched_handlers
+
+    async def handle_message_async(
+        self,
+        platform: str,
+        handler_names: Iterable[str],
+        context: BotContext,
+        message: Message,
+    ) -> list[str]:
+        """
+        Same as handle_message, but async handlers are awaited and sync handlers
+        run on the registry's executor instead of blocking the event loop
+        """
+        matched_handlers: list[str] = []
+
+        plan = self.dispatch_plan(platform, frozenset(handler_names))
+
+        # One scan to figure out which regex handlers are even worth trying
+        candidates = plan.regex_index.candidates(message.content)
+
+        for handler in plan.handlers:
             # We already matched at least one handler, don't run this one
             if matched_handlers and not handler.always_run:
                 continue
 
+            if handler.regexes and handler.name not in candidates:
+                continue
+
             logger.debug("Trying message handler %s ...", handler.name)
 
-            matched = handler.run(context, message)
+            matched = await handler.run_async(context, message, self.executor)
 
             # Keep track of the handlers that matched
             if matched:
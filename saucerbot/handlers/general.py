@@ -6,11 +6,10 @@ import random
 import tempfile
 from pathlib import Path
 
-import requests
-
 from saucerbot.groupme.models import GroupMeBotContext
 from saucerbot.groupme.utils import i_barely_know_her, janet
 from saucerbot.handlers import BotContext, Message, registry
+from saucerbot.utils import http
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +33,7 @@ def catfacts(context: BotContext) -> None:
     Sends catfacts!
     """
     if random.random() < CATFACTS_CHANCE:
-        catfact = requests.get(CATFACTS_URL).json()
+        catfact = http.get(CATFACTS_URL).json()
         context.post(catfact["fact"])
 
 
@@ -134,6 +134,33 @@ WHITENOISE_KEEP_ONLY_HASHED_FILES = True
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 
+# Caches
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# Set CACHE_URL to a redis:// URL (or to "db" to use a table in the database, after
+# running createcachetable) to add a "shared" cache that every worker can see.
+
+CACHE_URL: str | None = os.environ.get("CACHE_URL")
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+}
+
+if CACHE_URL == "db":
+    CACHES["shared"] = {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "saucerbot_cache",
+    }
+elif CACHE_URL:
+    CACHES["shared"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": CACHE_URL,
+    }
+
+SHARED_CACHE: str | None = "shared" if CACHE_URL else None
+
+
 # Add modules here that contain handlers.
 # They will get loaded when the server starts up
 
@@ -144,6 +171,74 @@ HANDLER_MODULES = [
     "saucerbot.groupme.handlers",
 ]
 
+# How many sync handlers may run at once for the discord bot
+
+HANDLER_EXECUTOR_WORKERS = int(os.environ.get("HANDLER_EXECUTOR_WORKERS", 8))
+
+# Enabled handlers for each bot & channel get cached in the shared cache when there
+# is one.  Whatever cache HANDLER_SET_CACHE names has to be shared by every worker
+# and the discord bot - with a per-process cache, handler changes wouldn't show up
+# in the other processes for up to HANDLER_SET_TTL seconds.  Without a cache, the
+# handlers are loaded from the database for every message.
+
+HANDLER_SET_CACHE: str | None = os.environ.get("HANDLER_SET_CACHE", SHARED_CACHE)
+
+HANDLER_SET_TTL = int(os.environ.get("HANDLER_SET_TTL", 5 * 60))
+
+# Acknowledge GroupMe callbacks right away, and run the handlers in the background.
+# When the queue is full, callbacks fall back to running handlers in the foreground.
+
+GROUPME_ASYNC_CALLBACKS = os.environ.get("GROUPME_ASYNC_CALLBACKS") in ("1", "true")
+
+CALLBACK_DISPATCH_WORKERS = int(os.environ.get("CALLBACK_DISPATCH_WORKERS", 4))
+
+CALLBACK_DISPATCH_QUEUE_SIZE = int(os.environ.get("CALLBACK_DISPATCH_QUEUE_SIZE", 100))
+
+# Looking up a GroupMe bot means listing every bot its owner has, so the bots &
+# groups are kept around for this long (in seconds)
+
+GROUPME_OBJECT_TTL = int(os.environ.get("GROUPME_OBJECT_TTL", 60 * 60))
+
+# Outgoing HTTP requests: the (connect, read) timeouts in seconds, and how many
+# connections to keep open to any single host
+
+HTTP_CONNECT_TIMEOUT = float(os.environ.get("HTTP_CONNECT_TIMEOUT", 3.05))
+
+HTTP_READ_TIMEOUT = float(os.environ.get("HTTP_READ_TIMEOUT", 10))
+
+HTTP_MAX_CONNECTIONS_PER_HOST = int(os.environ.get("HTTP_MAX_CONNECTIONS_PER_HOST", 10))
+
+# How long (in seconds) a scraped page gets used as-is before we ask the server
+# whether it changed
+
+PAGE_FRESH_TTL = int(os.environ.get("PAGE_FRESH_TTL", 60 * 60))
+
+# Which of the CACHES the ESPN schedule & scoreboard responses go in.  It's the
+# shared cache when there is one, so every worker doesn't hit ESPN on its own.
+
+SPORTS_CACHE = os.environ.get("SPORTS_CACHE", SHARED_CACHE or "default")
+
+# How long (in seconds) we'll wait on any team's results before replying without them
+
+TEAM_RESULT_TIMEOUT = float(os.environ.get("TEAM_RESULT_TIMEOUT", 8))
+
+# Answer "did the dores win" from the GameResult table instead of asking ESPN.
+# Only turn this on when the refreshscores command is running.
+
+GAME_RESULTS_FROM_DB = os.environ.get("GAME_RESULTS_FROM_DB") in ("1", "true")
+
+# Read today's Bridgestone events from the BridgestoneEvent table instead of
+# scraping the site.  Only turn this on when the scrapebridgestone command is running.
+
+BRIDGESTONE_EVENTS_FROM_DB = os.environ.get("BRIDGESTONE_EVENTS_FROM_DB") in (
+    "1",
+    "true",
+)
+
+# How many Bridgestone event pages we'll fetch at once
+
+EVENT_TIME_WORKERS = int(os.environ.get("EVENT_TIME_WORKERS", 4))
+
 
 REST_FRAMEWORK = {
     "EXCEPTION_HANDLER": "rollbar.contrib.django_rest_framework.post_exception_handler",
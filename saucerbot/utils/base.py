@@ -2,13 +2,14 @@
 
 import logging
 
-import requests
 from bs4 import BeautifulSoup
 
+from saucerbot.utils import http
+
 logger = logging.getLogger(__name__)
 
 
 def get_insult() -> str:
-    r = requests.get("https://www.robietherobot.com/insult-generator.htm", verify=False)
+    r = http.get("https://www.robietherobot.com/insult-generator.htm", verify=False)
     soup = BeautifulSoup(r.text, "html.parser")
     return soup.select("center > table > tr > td > h1")[0].text.strip()
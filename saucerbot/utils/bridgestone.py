@@ -1,14 +1,21 @@
 # -*- coding: utf-8 -*-
 
+import bisect
+import calendar
+import datetime
 import logging
 import random
 import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import arrow
 from arrow.parser import ParserError
+from django.conf import settings
 from requests.exceptions import RequestException
 
+from saucerbot.utils.cache import TTLCache
 from saucerbot.utils.parsers import (
     BridgestoneEventsParser,
     BridgestoneEventTimeParser,
@@ -17,7 +24,18 @@ from saucerbot.utils.parsers import (
 
 logger = logging.getLogger(__name__)
 
-__bridgestone_date_pattern = r"MMM[\s*]D"
+# Event times keyed by the event's details URL.  They're kept until the event is over.
+event_times: TTLCache[str, str] = TTLCache(24 * 60 * 60, maxsize=256)
+
+_event_time_executor = ThreadPoolExecutor(
+    max_workers=settings.EVENT_TIME_WORKERS, thread_name_prefix="bridgestone"
+)
+
+# Just the month & day out of things like "Sep 03", "June 12" or "Sep 23 - 26"
+__bridgestone_date_regex = re.compile(r"([A-Za-z]{3})[A-Za-z]*\.?\s*(\d{1,2})")
+__months = {
+    abbr.lower(): month for month, abbr in enumerate(calendar.month_abbr) if abbr
+}
 __bridgestone_time_pattern = r"h:mm[\s*]A"
 __message_formats = [
     "Better get there early: {event} at Bridgestone{time} tonight!",
@@ -40,53 +58,118 @@ __general_quips = [
 bridgestone_events_url = "https://www.bridgestonearena.com/events"
 
 
+def _as_date(value: Any) -> datetime.date:
+    # Arrows & datetimes both know their date, plain dates are already there
+    return (
+        value.date() if isinstance(value, (arrow.Arrow, datetime.datetime)) else value
+    )
+
+
+class EventCalendar:
+    """
+    Scraped events, bucketed by date
+    """
+
+    def __init__(self, events: Iterable[dict[str, Any]]) -> None:
+        self.events = list(events)
+        self._by_date: dict[datetime.date, list[dict[str, Any]]] = {}
+        for ev in self.events:
+            self._by_date.setdefault(_as_date(ev["parsed_date"]), []).append(ev)
+        self._dates = sorted(self._by_date)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def on(self, date: datetime.date) -> list[dict[str, Any]]:
+        return list(self._by_date.get(_as_date(date), ()))
+
+    def events_between(
+        self, start: datetime.date, end: datetime.date
+    ) -> list[dict[str, Any]]:
+        """
+        All the events from start to end (inclusive), in date order
+        """
+        first = bisect.bisect_left(self._dates, _as_date(start))
+        last = bisect.bisect_right(self._dates, _as_date(end))
+        return [ev for date in self._dates[first:last] for ev in self._by_date[date]]
+
+
+def get_event_calendar() -> EventCalendar:
+    return EventCalendar(get_all_events(HtmlContentProvider(bridgestone_events_url)))
+
+
 def get_todays_events() -> list[dict[str, Any]]:
     today = arrow.now("US/Central")
-    all_events = get_all_events(HtmlContentProvider(bridgestone_events_url))
-    return get_events_for_date(all_events, today)
+    if settings.BRIDGESTONE_EVENTS_FROM_DB:
+        # The scrapebridgestone command keeps these up to date
+        # pylint: disable=import-outside-toplevel
+        from saucerbot.core.models import BridgestoneEvent
+
+        return BridgestoneEvent.objects.on(today.date())
+
+    return get_event_calendar().on(today.date())
+
+
+def get_todays_events_with_times() -> list[dict[str, Any]]:
+    """
+    Get today's events, with each one's start time (or None) under "time".
+    The event pages all get fetched at the same time, unless the times were
+    already stored.
+    """
+    events = get_todays_events()
+    missing = [event for event in events if "time" not in event]
+    for event, event_time in zip(missing, get_event_times(missing)):
+        event["time"] = event_time
+    return events
 
 
 def get_events_for_date(events: list[dict[str, Any]], date) -> list[dict[str, Any]]:
-    results = []
-    for ev in events:
-        event_date = ev["parsed_date"]
-        if date.day == event_date.day and date.month == event_date.month:
-            results.append(ev)
-    return results
+    return EventCalendar(events).on(date)
 
 
-def get_year(month: int) -> int:
-    current_date = arrow.now()
-    current_year = current_date.date().year
+def get_year(month: int, today: datetime.date | None = None) -> int:
+    current_date = today or arrow.now().date()
 
-    if month >= current_date.date().month:
-        return current_year
+    if month >= current_date.month:
+        return current_date.year
     else:
-        return current_year + 1
+        return current_date.year + 1
+
+
+def parse_event_date(date_str: str, today: datetime.date) -> datetime.date | None:
+    # WTF Bridgestone, just use 3 letter months everywhere
+    match = __bridgestone_date_regex.search(date_str)
+    if not match:
+        return None
+
+    month = __months.get(match.group(1).lower())
+    if not month:
+        return None
+
+    try:
+        return datetime.date(get_year(month, today), month, int(match.group(2)))
+    except ValueError:
+        return None
 
 
 def get_all_events(provider: HtmlContentProvider) -> list[dict[str, Any]]:
+    today = arrow.now().date()
     events = []
     for ev in BridgestoneEventsParser(provider).parse():
         if ev["date"]:
-            # WTF Bridgestone, just use 3 letter months everywhere
-            fixed_date = ev["date"].replace("June", "Jun").replace("July", "Jul")
-            try:
-                parsed_date = arrow.get(fixed_date, __bridgestone_date_pattern)
-                ev["parsed_date"] = parsed_date.replace(
-                    year=get_year(parsed_date.date().month)
-                )
+            parsed_date = parse_event_date(ev["date"], today)
+            if parsed_date:
+                ev["parsed_date"] = parsed_date
                 events.append(ev)
-            except ParserError:
-                logger.info("Failed to parse date '%s'", fixed_date)
+            else:
+                logger.info("Failed to parse date '%s'", ev["date"])
                 # Date won't parse, just skip it
-                continue
     return events
 
 
 def create_message(event: dict[str, Any]) -> str:
     template = random.choice(__message_formats)
-    time_string = get_event_time(event)
+    time_string = event["time"] if "time" in event else get_event_time(event)
     if not time_string:
         time_string = ""
     else:
@@ -101,8 +184,31 @@ def create_message(event: dict[str, Any]) -> str:
 
 
 def get_event_time(event: dict[str, Any]) -> str | None:
+    event_time = event_times.get(event["details"])
+    if event_time is not None:
+        return event_time
+
     provider = BridgestoneEventTimeParser.create_event_time_provider(event)
-    return get_event_time_helper(provider, event["name"])
+    event_time = get_event_time_helper(provider, event["name"])
+
+    # Only cache what we found, a failed lookup can try again next time
+    if event_time is not None:
+        event_times.set(event["details"], event_time, __seconds_until_over(event))
+    return event_time
+
+
+def get_event_times(events: list[dict[str, Any]]) -> list[str | None]:
+    return list(_event_time_executor.map(get_event_time, events))
+
+
+def __seconds_until_over(event: dict[str, Any]) -> float:
+    parsed_date = event.get("parsed_date")
+    if not parsed_date:
+        return event_times.ttl
+    end_of_day = arrow.Arrow(
+        parsed_date.year, parsed_date.month, parsed_date.day, tzinfo="US/Central"
+    ).ceil("day")
+    return max((end_of_day - arrow.now("US/Central")).total_seconds(), 60)
 
 
 def get_event_time_helper(provider: HtmlContentProvider, event_name: str) -> str | None:
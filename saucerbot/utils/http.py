@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+import logging
+import threading
+import time
+import weakref
+from collections.abc import Mapping
+from typing import Any, NamedTuple
+from urllib.parse import urlsplit
+
+import aiohttp
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Only idempotent requests get retried
+RETRY_METHODS = frozenset({"GET", "HEAD"})
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 2
+BACKOFF_FACTOR = 0.3
+
+
+def default_timeout() -> tuple[float, float]:
+    """
+    The (connect, read) timeout in seconds for requests that don't set their own
+    """
+    return settings.HTTP_CONNECT_TIMEOUT, settings.HTTP_READ_TIMEOUT
+
+
+class HostLatency:
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def __repr__(self):
+        return (
+            f"HostLatency(count={self.count}, errors={self.errors}, "
+            f"mean={self.mean:.3f}, max={self.max:.3f})"
+        )
+
+
+class LatencyStats:
+    """
+    Per-host request counts & timings for everything that goes through this module
+    """
+
+    def __init__(self):
+        self._hosts: dict[str, HostLatency] = {}
+        self._lock = threading.Lock()
+
+    def record(self, url: str, elapsed: float, error: bool = False) -> None:
+        host = urlsplit(url).hostname or ""
+        with self._lock:
+            stats = self._hosts.setdefault(host, HostLatency())
+            stats.count += 1
+            stats.total += elapsed
+            stats.max = max(stats.max, elapsed)
+            if error:
+                stats.errors += 1
+
+        logger.debug("%s request took %.3fs", host, elapsed)
+
+    def get(self, host: str) -> HostLatency | None:
+        return self._hosts.get(host)
+
+    def snapshot(self) -> dict[str, HostLatency]:
+        with self._lock:
+            return dict(self._hosts)
+
+
+latency = LatencyStats()
+
+
+class PooledSession(requests.Session):
+    """
+    A requests session with keep-alive connection pooling, default timeouts,
+    and retries with backoff for idempotent requests
+    """
+
+    def __init__(self, timeout: tuple[float, float] | None = None):
+        super().__init__()
+        self.timeout = timeout
+
+        retry = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=BACKOFF_FACTOR,
+            allowed_methods=RETRY_METHODS,
+            status_forcelist=RETRY_STATUSES,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_maxsize=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+            pool_block=True,
+            max_retries=retry,
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, method, url, *args, **kwargs):  # type: ignore[override]
+        kwargs.setdefault("timeout", self.timeout or default_timeout())
+
+        start = time.monotonic()
+        error = True
+        try:
+            response = super().request(method, url, *args, **kwargs)
+            error = response.status_code >= 400
+            return response
+        finally:
+            latency.record(url, time.monotonic() - start, error)
+
+
+session = PooledSession()
+
+
+def get(url: str, **kwargs: Any) -> requests.Response:
+    return session.get(url, **kwargs)
+
+
+def post(url: str, **kwargs: Any) -> requests.Response:
+    return session.post(url, **kwargs)
+
+
+class AsyncResponse(NamedTuple):
+    """
+    The parts of an aiohttp response we care about, read fully so the
+    connection can go back to the pool
+    """
+
+    url: str
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+
+_async_sessions: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, aiohttp.ClientSession
+] = weakref.WeakKeyDictionary()
+
+
+def get_async_session() -> aiohttp.ClientSession:
+    """
+    Get the pooled aiohttp session for the running event loop
+    """
+    loop = asyncio.get_running_loop()
+    async_session = _async_sessions.get(loop)
+    if async_session is None or async_session.closed:
+        connect_timeout, read_timeout = default_timeout()
+        async_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit_per_host=settings.HTTP_MAX_CONNECTIONS_PER_HOST
+            ),
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=connect_timeout, sock_read=read_timeout
+            ),
+        )
+        _async_sessions[loop] = async_session
+    return async_session
+
+
+async def aclose() -> None:
+    """
+    Close the aiohttp session for the running event loop, if there is one
+    """
+    async_session = _async_sessions.pop(asyncio.get_running_loop(), None)
+    if async_session is not None and not async_session.closed:
+        await async_session.close()
+
+
+async def arequest(method: str, url: str, **kwargs: Any) -> AsyncResponse:
+    retries = MAX_RETRIES if method.upper() in RETRY_METHODS else 0
+    attempt = 0
+
+    while True:
+        start = time.monotonic()
+        try:
+            async with get_async_session().request(method, url, **kwargs) as r:
+                response = AsyncResponse(
+                    str(r.url), r.status, r.headers, await r.read()
+                )
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            latency.record(url, time.monotonic() - start, error=True)
+            if attempt >= retries:
+                raise
+        else:
+            latency.record(url, time.monotonic() - start, error=not response.ok)
+            if response.status_code not in RETRY_STATUSES or attempt >= retries:
+                return response
+
+        await asyncio.sleep(BACKOFF_FACTOR * (2**attempt))
+        attempt += 1
+
+
+async def aget(url: str, **kwargs: Any) -> AsyncResponse:
+    return await arequest("GET", url, **kwargs)
+
+
+async def apost(url: str, **kwargs: Any) -> AsyncResponse:
+    return await arequest("POST", url, **kwargs)
@@ -1,10 +1,34 @@
 # -*- coding: utf-8 -*-
 
+import logging
+import time
 from collections.abc import Iterable, Iterator
-from typing import Any
+from functools import cached_property
+from typing import Any, NamedTuple
 
-import requests
+import soupsieve
 from bs4 import BeautifulSoup
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+try:
+    from cssselect import HTMLTranslator
+    from lxml import etree as lxml_etree
+    from lxml import html as lxml_html
+except ImportError:  # pragma: no cover
+    lxml_etree = None  # type: ignore[assignment]
+    lxml_html = None  # type: ignore[assignment]
+
+from saucerbot.utils import http
+from saucerbot.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# After this long we forget about a page entirely
+PAGE_MAX_AGE = 24 * 60 * 60
+PAGE_CACHE_SIZE = 32
+
+_lxml_parser = lxml_html.HTMLParser(encoding="utf-8") if lxml_html is not None else None
 
 
 class RowMismatchError(Exception):
@@ -15,29 +39,230 @@ class MissingBaseError(Exception):
     pass
 
 
+class Page:
+    """
+    The html for a page, parsed lazily by whichever backends ask for it
+    """
+
+    def __init__(self, html: str) -> None:
+        self.html = html
+
+    @cached_property
+    def soup(self) -> BeautifulSoup:
+        return BeautifulSoup(self.html, "html.parser")
+
+    @cached_property
+    def tree(self) -> Any:
+        if lxml_html is None:
+            raise ImproperlyConfigured("lxml is required for the lxml parser backend")
+        return lxml_html.document_fromstring(self.html.encode(), parser=_lxml_parser)
+
+
+class CachedPage(NamedTuple):
+    page: Page
+    etag: str | None
+    last_modified: str | None
+    checked_at: float
+
+
+pages: TTLCache[str, CachedPage] = TTLCache(PAGE_MAX_AGE, PAGE_CACHE_SIZE)
+
+
+def get_page(url: str) -> Page:
+    """
+    Get the page at a URL.  Pages (and their parsed trees) are shared between
+    providers, and once they're stale we use a conditional GET so an unchanged
+    page isn't re-parsed.
+    """
+    cached = pages.get(url)
+    if cached and time.monotonic() - cached.checked_at < settings.PAGE_FRESH_TTL:
+        return cached.page
+
+    headers = {}
+    if cached and cached.etag:
+        headers["If-None-Match"] = cached.etag
+    if cached and cached.last_modified:
+        headers["If-Modified-Since"] = cached.last_modified
+
+    r = http.get(url, headers=headers)
+    if cached and r.status_code == 304:
+        logger.debug("%s hasn't changed", url)
+        pages.set(url, cached._replace(checked_at=time.monotonic()))
+        return cached.page
+
+    r.raise_for_status()
+    page = Page(r.text)
+    pages.set(
+        url,
+        CachedPage(
+            page,
+            r.headers.get("ETag"),
+            r.headers.get("Last-Modified"),
+            time.monotonic(),
+        ),
+    )
+    return page
+
+
 class HtmlContentProvider:
     def __init__(self, url: str, *args: Any) -> None:
         self.url = url.format(*args)
-        self.soup: BeautifulSoup | None = None
+        self.page: Page | None = None
+
+    def get_page(self) -> Page:
+        if not self.page:
+            self.page = get_page(self.url)
+        return self.page
 
     def get_content(self) -> BeautifulSoup:
-        if not self.soup:
-            r = requests.get(self.url)
-            r.raise_for_status()
-            self.soup = BeautifulSoup(r.text, "html.parser")
-        return self.soup
+        return self.get_page().soup
+
+    def get_tree(self) -> Any:
+        return self.get_page().tree
+
+
+class ParserBackend:
+    """
+    How a Parser finds rows & fields, and reads elements.  Each Parser class gets
+    its own backend instances with its selectors already compiled.
+    """
+
+    available = True
+
+    def __init__(self, base: str, selectors: list[str]) -> None:
+        self.base = base
+        self.selectors = selectors
+
+    def rows(self, provider: HtmlContentProvider) -> Iterable[Any]:
+        raise NotImplementedError()
+
+    def select_fields(self, row: Any) -> list[list[Any]]:
+        """
+        Find the elements matching each of the field selectors in a row
+        """
+        raise NotImplementedError()
+
+    def tag(self, element: Any) -> str:
+        raise NotImplementedError()
+
+    def text(self, element: Any) -> str:
+        raise NotImplementedError()
+
+    def attr(self, element: Any, attribute: str) -> str | None:
+        raise NotImplementedError()
+
+
+class SoupBackend(ParserBackend):
+    def __init__(self, base: str, selectors: list[str]) -> None:
+        super().__init__(base, selectors)
+        self.base_selector = soupsieve.compile(base)
+        self.field_selectors = [soupsieve.compile(selector) for selector in selectors]
+        # Every field at once, so a row only gets walked one time
+        self.any_field_selector = soupsieve.compile(", ".join(selectors) or "*")
+
+    def rows(self, provider: HtmlContentProvider) -> Iterable[Any]:
+        return self.base_selector.select(provider.get_content())
+
+    def select_fields(self, row: Any) -> list[list[Any]]:
+        matches: list[list[Any]] = [[] for _ in self.field_selectors]
+        if not self.field_selectors:
+            return matches
+
+        # Then sort out which field(s) each element we found belongs to
+        for element in self.any_field_selector.select(row):
+            for matched, selector in zip(matches, self.field_selectors):
+                if selector.match(element):
+                    matched.append(element)
+        return matches
+
+    def tag(self, element: Any) -> str:
+        return element.name
+
+    def text(self, element: Any) -> str:
+        return element.text
+
+    def attr(self, element: Any, attribute: str) -> str | None:
+        return element.attrs.get(attribute)
+
+
+class LxmlBackend(ParserBackend):
+    available = lxml_etree is not None
+
+    def __init__(self, base: str, selectors: list[str]) -> None:
+        super().__init__(base, selectors)
+        if lxml_etree is None:
+            raise ImproperlyConfigured("lxml is required for the lxml parser backend")
+
+        translator = HTMLTranslator()
+        self.base_xpath = lxml_etree.XPath(translator.css_to_xpath(base))
+        # Like soupsieve, fields only match below the row, not the row itself
+        self.xpaths = [
+            lxml_etree.XPath(translator.css_to_xpath(selector, prefix="descendant::"))
+            for selector in selectors
+        ]
+
+    def rows(self, provider: HtmlContentProvider) -> Iterable[Any]:
+        return self.base_xpath(provider.get_tree())
+
+    def select_fields(self, row: Any) -> list[list[Any]]:
+        # libxml2 walks the row for each of these, but that's all in C
+        return [xpath(row) for xpath in self.xpaths]
+
+    def tag(self, element: Any) -> str:
+        return element.tag
+
+    def text(self, element: Any) -> str:
+        return str(element.text_content())
+
+    def attr(self, element: Any, attribute: str) -> str | None:
+        return element.get(attribute)
+
+
+BACKENDS: dict[str, type[ParserBackend]] = {
+    "soup": SoupBackend,
+    "lxml": LxmlBackend,
+}
+
+DEFAULT_BACKEND = "lxml" if LxmlBackend.available else "soup"
 
 
 class Parser:
     base = ""
     fields: list[tuple[str, str, str | None]] = []
 
-    def __init__(self, provider: HtmlContentProvider) -> None:
+    # Which of the BACKENDS to use, defaults to DEFAULT_BACKEND
+    backend: str | None = None
+
+    # Filled in for each subclass when it's created
+    _backends: dict[str, ParserBackend] = {}
+    _guessed_types: list[str] = []
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        selectors = [selector for _, selector, _ in cls.fields]
+
+        # Guess what a missing field would have been from its selector
+        cls._guessed_types = [
+            selector.split(" > ")[-1].split(":")[0] for selector in selectors
+        ]
+
+        # Compile the selectors once, rather than for every row of every page
+        cls._backends = {
+            name: backend_class(cls.base, selectors)
+            for name, backend_class in BACKENDS.items()
+            if cls.base and backend_class.available
+        }
+
+    def __init__(
+        self, provider: HtmlContentProvider, backend: str | None = None
+    ) -> None:
         super().__init__()
         if not provider:
             raise ValueError("Value for provider required.")
 
         self.provider = provider
+        self.backend_name = backend or self.backend or DEFAULT_BACKEND
         self.types: dict[str, Any] = {}
 
     def parse(self) -> Iterable[dict[str, Any]]:
@@ -49,11 +274,8 @@ class Parser:
         for row in self._do_initial_parse():
             yield self.post_process(row)
 
-    def _handle_missing_field(self, field: str, selector: str) -> Any:
-        next_type = self.types.get(field)
-        if not next_type:
-            # try to guess it
-            next_type = selector.split(" > ")[-1].split(":")[0]
+    def _handle_missing_field(self, field: str, guessed_type: str) -> Any:
+        next_type = self.types.get(field) or guessed_type
 
         if next_type:
             if next_type == "a":
@@ -63,43 +285,60 @@ class Parser:
 
         return None
 
-    def _process_row(self, row, field: str, selector: str, attribute=None) -> Any:
-        columns = row.select(selector)
+    def _process_row(
+        self,
+        backend: ParserBackend,
+        columns: list[Any],
+        field_spec: tuple[str, str, str | None],
+        guessed_type: str,
+    ) -> Any:
+        field, _, attribute = field_spec
 
         if not columns:
-            return self._handle_missing_field(field, selector)
+            return self._handle_missing_field(field, guessed_type)
         elif len(columns) > 1:
             raise RowMismatchError()
 
         # grab the first one
         column = columns[0]
+        tag = backend.tag(column)
 
         # Check to make sure it's the correct type
-        if field in self.types and self.types[field] != column.name:
+        if field in self.types and self.types[field] != tag:
             raise RowMismatchError()
 
-        self.types[field] = column.name
+        self.types[field] = tag
 
         if attribute:
-            return column.attrs.get(attribute)
-        elif column.name == "a":
-            return {"text": column.text, "href": column.attrs.get("href")}
-        elif column.name == "img":
-            return column.attrs.get("src")
+            return backend.attr(column, attribute)
+        elif tag == "a":
+            return {"text": backend.text(column), "href": backend.attr(column, "href")}
+        elif tag == "img":
+            return backend.attr(column, "src")
         else:
-            return column.text
+            return backend.text(column)
 
     def _do_initial_parse(self) -> Iterator[dict[str, Any]]:
         if not self.base:
             raise MissingBaseError()
 
+        backend = self._backends.get(self.backend_name)
+        if backend is None:
+            raise ImproperlyConfigured(
+                f"The {self.backend_name} parser backend isn't available"
+            )
+
         # Scrape the fields out of the html
-        for row in self.provider.get_content().select(self.base):
+        for row in backend.rows(self.provider):
             next_row: dict[str, Any] = {}
-            for field, selector, attribute in self.fields:
-                next_field = self._process_row(row, field, selector, attribute)
+            for field_spec, guessed_type, columns in zip(
+                self.fields, self._guessed_types, backend.select_fields(row)
+            ):
+                next_field = self._process_row(
+                    backend, columns, field_spec, guessed_type
+                )
                 if next_field:
-                    next_row[field] = next_field
+                    next_row[field_spec[0]] = next_field
 
             yield next_row
 
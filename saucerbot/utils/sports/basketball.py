@@ -2,7 +2,7 @@ import logging
 
 from arrow import arrow
 
-from saucerbot.utils.sports.models import Team, VandyResult
+from saucerbot.utils.sports.models import ScheduleEvent, Team, VandyResult
 from saucerbot.utils.sports.schedule_page_utils import get_schedule_page_results
 
 ESPN_MENS_BASKETBALL_URL = "https://www.espn.com/mens-college-basketball/team/schedule/_/id/238/vanderbilt-commodores"
@@ -48,18 +48,9 @@ class WomensBasketball(Team):
 
 
 def _get_vandy_result_from_schedule_event(
-    team_name: str, event: dict | None
+    team_name: str, event: ScheduleEvent | None
 ) -> VandyResult | None:
     if event is None:
         return None
 
-    return VandyResult(
-        date=event["date"],
-        opponent=event["opponent"]["displayName"],
-        opponent_score=int(event["result"].get("opponentTeamScore", -1)),
-        vandy_team=team_name,
-        vandy_score=int(
-            event["result"].get("currentTeamScore", -1)
-        ),  # no guarantee that there are scores
-        is_finished=event["status"]["completed"],
-    )
+    return event.to_result(team_name)
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+import logging
+import time
+from collections.abc import Callable
+from typing import Any, NamedTuple, TypeVar
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+
+from saucerbot.core.dispatch import BackgroundDispatcher
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# How long an ESPN response stays fresh depends on the state of the games in it
+LIVE_TTL = 60
+UPCOMING_TTL = 15 * 60
+FINAL_TTL = 12 * 60 * 60
+
+# How long past expiry we'll keep handing out a response while it gets refreshed
+STALE_TTL = 24 * 60 * 60
+
+# Only one worker should be refreshing a given URL at a time
+REFRESH_LOCK_TTL = 60
+
+refresher = BackgroundDispatcher("sports-refresh", 2, 20)
+
+
+class CachedResponse(NamedTuple):
+    value: Any
+    expires_at: float
+
+
+def _get_cache() -> BaseCache:
+    return caches[settings.SPORTS_CACHE]
+
+
+def _key(url: str) -> str:
+    return f"espn:{url}"
+
+
+def _store(url: str, value: T, ttl: Callable[[T], float]) -> T:
+    fresh_for = ttl(value)
+    _get_cache().set(
+        _key(url),
+        CachedResponse(value, time.time() + fresh_for),
+        fresh_for + STALE_TTL,
+    )
+    return value
+
+
+def _refresh(url: str, fetch: Callable[[], T], ttl: Callable[[T], float]) -> None:
+    try:
+        _store(url, fetch(), ttl)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        # This runs in the background, so nothing else would see the error.
+        # Keep serving the stale one, we'll try again next time
+        logger.warning("Failed to refresh %s", url, exc_info=e)
+    finally:
+        _get_cache().delete(_key(url) + ":refreshing")
+
+
+def get_or_fetch(url: str, fetch: Callable[[], T], ttl: Callable[[T], float]) -> T:
+    """
+    Get the (processed) response for an ESPN url, fetching it on a miss.
+    Once a response expires it's still returned for a while, with a refresh
+    kicked off in the background.
+    :param url: the url the response comes from
+    :param fetch: fetches & processes the response
+    :param ttl: how many seconds a given response stays fresh
+    :return: the processed response
+    """
+    cache = _get_cache()
+    cached: CachedResponse | None = cache.get(_key(url))
+
+    if cached is None:
+        logger.debug("ESPN cache miss for %s", url)
+        return _store(url, fetch(), ttl)
+
+    if cached.expires_at <= time.time():
+        logger.debug("ESPN cache entry for %s is stale", url)
+        if cache.add(_key(url) + ":refreshing", True, REFRESH_LOCK_TTL):
+            if not refresher.submit(_refresh, url, fetch, ttl):
+                # Nowhere to run it, don't block the next caller from trying
+                cache.delete(_key(url) + ":refreshing")
+
+    return cached.value
+
+
+def clear(url: str) -> None:
+    _get_cache().delete(_key(url))
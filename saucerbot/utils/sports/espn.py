@@ -64,3 +64,19 @@ class ESPNFootballEvent(BaseModel):
 
 class ESPNScoreboard(BaseModel):
     events: list[ESPNFootballEvent]
+
+
+def find_team_event(scoreboard: dict, location: str) -> ESPNFootballEvent | None:
+    """
+    Find a team's game in a raw scoreboard response.  Validating every event on
+    the board is slow, so only the one we're after gets validated.
+    :param scoreboard: the decoded scoreboard json
+    :param location: the team's location, e.g. "Vanderbilt"
+    :return: the validated event, or None if the team isn't on the board
+    """
+    for event in scoreboard.get("events", ()):
+        competitions: list[dict] = event.get("competitions") or [{}]
+        for competitor in competitions[0].get("competitors", ()):
+            if competitor.get("team", {}).get("location") == location:
+                return ESPNFootballEvent.model_validate(event)
+    return None
@@ -7,13 +7,23 @@ import arrow
 import requests
 from pydantic import BaseModel
 
-from saucerbot.utils.sports.espn import ESPNFootballEvent, ESPNScoreboard
-from saucerbot.utils.sports.models import Team, VandyResult
+from saucerbot.utils import http
+from saucerbot.utils.sports import cache as sports_cache
+from saucerbot.utils.sports.espn import ESPNFootballEvent, find_team_event
+from saucerbot.utils.sports.models import ScheduleEvent, Team, VandyResult
+from saucerbot.utils.sports.schedule_page_utils import SeasonSchedule, schedule_ttl
 from saucerbot.utils.time_utils import get_date_from_string
 
 logger = logging.getLogger(__name__)
 
 
+ESPN_FOOTBALL_SCHEDULE_URL = (
+    "https://site.api.espn.com/apis/site/v2/sports/football/college-football"
+    "/teams/{team_id}/schedule?season={year}&seasontype={season}"
+)
+
+VANDY_TEAM_ID = "238"
+
 ESPN_FOOTBALL_URL = (
     "https://site.api.espn.com/apis/site/v2/sports/football/college-football/scoreboard"
     "?lang=en&region=us&calendartype=blacklist&limit=300&dates={year}"
@@ -30,6 +40,16 @@ class VandyFootball(Team):
         return desired_date.month >= 8 or desired_date.month < 2
 
     def get_latest_result(self, desired_date: arrow.Arrow):
+        try:
+            event = get_football_schedule_result(desired_date)
+        except (requests.RequestException, KeyError, IndexError, ValueError) as e:
+            logger.warning(
+                "Failed to read the football schedule, trying the scoreboard",
+                exc_info=e,
+            )
+        else:
+            return event.to_result(self.name) if event else None
+
         game_info = get_football_results(desired_date)
         if game_info is None:
             return None
@@ -66,6 +86,87 @@ class VandyFootball(Team):
             return team2, team1
 
 
+def get_football_schedule_result(desired_date: arrow.Arrow) -> ScheduleEvent | None:
+    """
+    Find this week's game in Vandy's schedule, even if it hasn't been played yet
+    (or during bowl season, the bowl game), falling back to the latest game before
+    the date.  The schedule only gets fetched once for the whole season (and again
+    as games finish).
+    """
+    if 1 < desired_date.month < 8:
+        return None
+    if (desired_date.month == 12 and desired_date.day > 11) or desired_date.month == 1:
+        season_type = 3  # code for bowl season
+        # The bowl schedule is all one week, just like on the scoreboard
+        week_start, week_end = datetime.date.min, datetime.date.max
+    else:
+        season_type = 2  # code for regular season
+        week_start = __get_week_start(desired_date)
+        week_end = week_start + datetime.timedelta(days=7)
+    # bowl games in January are still part of last year's season
+    year = desired_date.year - 1 if desired_date.month == 1 else desired_date.year
+
+    url = ESPN_FOOTBALL_SCHEDULE_URL.format(
+        team_id=VANDY_TEAM_ID, year=year, season=season_type
+    )
+    schedule = sports_cache.get_or_fetch(
+        url, lambda: read_football_schedule(__request_json(url)), schedule_ttl
+    )
+    latest = schedule.latest_on_or_before(desired_date.date())
+    if latest is not None and latest.date >= week_start:
+        return latest
+
+    upcoming = schedule.next_after(desired_date.date())
+    if upcoming is not None and upcoming.date < week_end:
+        return upcoming
+
+    return latest
+
+
+def __request_json(url: str) -> dict:
+    logger.debug("Requesting URL '%s'", url)
+    response = http.get(url)
+    response.raise_for_status()
+    return response.json()
+
+
+def read_football_schedule(data: dict) -> SeasonSchedule:
+    events = (__read_football_event(event) for event in data["events"])
+    return SeasonSchedule.from_events(event for event in events if event)
+
+
+def __read_football_event(event: dict) -> ScheduleEvent | None:
+    competition = event["competitions"][0]
+
+    vandy = opponent = None
+    for competitor in competition["competitors"]:
+        if str(competitor["id"]) == VANDY_TEAM_ID:
+            vandy = competitor
+        else:
+            opponent = competitor
+
+    if vandy is None or opponent is None:
+        return None
+
+    status = competition.get("status") or event["status"]
+    return ScheduleEvent(
+        date=get_date_from_string(event["date"]),
+        opponent=opponent["team"]["displayName"],
+        vandy_score=__read_score(vandy),
+        opponent_score=__read_score(opponent),
+        completed=status["type"]["completed"],
+    )
+
+
+def __read_score(competitor: dict) -> int:
+    # The schedule gives scores as {"value": 21.0, "displayValue": "21"}
+    # no guarantee that there are scores
+    score = competitor.get("score", -1)
+    if isinstance(score, dict):
+        score = score.get("value", -1)
+    return int(float(score))
+
+
 def get_football_results(desired_date: arrow.Arrow) -> ESPNFootballEvent | None:
     logger.debug("Getting the football results")
     if (
@@ -83,28 +184,40 @@ def get_football_results(desired_date: arrow.Arrow) -> ESPNFootballEvent | None:
     url = ESPN_FOOTBALL_URL.format(
         year=desired_date.year, week=week, season=season_type
     )
+    try:
+        return sports_cache.get_or_fetch(url, lambda: __request_game(url), football_ttl)
+    except requests.RequestException:
+        return None
+
+
+def __request_game(url: str) -> ESPNFootballEvent | None:
     logger.debug("Requesting URL '%s'", url)
-    response = requests.get(url)
-    if 200 <= response.status_code < 300:
-        scoreboard = ESPNScoreboard.model_validate(response.json())
-        return __get_the_dores_game(scoreboard)
-    else:
+    response = http.get(url)
+    if response.status_code >= 300 or response.status_code < 200:
         logger.warning(
             "Received non-success response code: %i -- %s",
             response.status_code,
             response.text,
         )
-        return None
+        # Raise so the failure doesn't get cached
+        response.raise_for_status()
+    game = find_team_event(response.json(), "Vanderbilt")
+    if game is None:
+        logger.info("Looked through all the events, couldn't find the Vandy game")
+    return game
 
 
-def __get_the_dores_game(scores: ESPNScoreboard) -> ESPNFootballEvent | None:
-    for event in scores.events:
-        teams = event.competitions[0].competitors
-        for team in teams:
-            if team.team.location == "Vanderbilt":
-                return event
-    logger.info("Looked through all the events, couldn't find the Vandy game")
-    return None
+def football_ttl(game: ESPNFootballEvent | None) -> float:
+    """
+    Check back often while the game's on, and hardly at all once it's final
+    """
+    if game is None:
+        return sports_cache.UPCOMING_TTL
+    if game.status.type.completed:
+        return sports_cache.FINAL_TTL
+    if game.date <= arrow.utcnow().shift(hours=+1).datetime:
+        return sports_cache.LIVE_TTL
+    return sports_cache.UPCOMING_TTL
 
 
 def __get_week(desired_date: arrow.Arrow) -> int:
@@ -114,11 +227,23 @@ def __get_week(desired_date: arrow.Arrow) -> int:
     :param desired_date: the date we're checking the week from
     :return: the week number
     """
-    labor_day = arrow.get(datetime.datetime(desired_date.year, 9, 1), "US/Central")
-    while labor_day.weekday() != 0:
-        labor_day = labor_day.shift(days=+1)
-    # we'll say Thursday is the one we want to calculate from
-    week_1 = labor_day.shift(days=-4)
+    week_1 = __get_week_1(desired_date.year)
     diff = desired_date - week_1
     week = int(math.floor(diff.days / 7)) + 1
     return week
+
+
+def __get_week_start(desired_date: arrow.Arrow) -> datetime.date:
+    """
+    The Thursday the week (as in __get_week) with the date in it starts on
+    """
+    week_1 = __get_week_1(desired_date.year)
+    return week_1.shift(weeks=__get_week(desired_date) - 1).date()
+
+
+def __get_week_1(year: int) -> arrow.Arrow:
+    labor_day = arrow.get(datetime.datetime(year, 9, 1), "US/Central")
+    while labor_day.weekday() != 0:
+        labor_day = labor_day.shift(days=+1)
+    # we'll say Thursday is the one we want to calculate from
+    return labor_day.shift(days=-4)
@@ -1,10 +1,20 @@
 import datetime
+import logging
+import time
 from abc import ABCMeta
-from typing import Optional
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import NamedTuple, Optional
 
 import arrow
+from django.conf import settings
 from pydantic import BaseModel
 
+logger = logging.getLogger(__name__)
+
+_team_executor = ThreadPoolExecutor(thread_name_prefix="team-results")
+
 
 class VandyResult(BaseModel):
     date: datetime.date
@@ -21,6 +31,29 @@ class VandyResult(BaseModel):
         return self.is_finished and self.vandy_score < self.opponent_score
 
 
+class ScheduleEvent(NamedTuple):
+    """
+    Just the parts of an ESPN schedule event we use
+    """
+
+    date: datetime.date
+    opponent: str
+    vandy_score: int
+    opponent_score: int
+    completed: bool
+
+    def to_result(self, vandy_team: str) -> VandyResult:
+        # These came straight from ESPN's types, no need to validate them again
+        return VandyResult.model_construct(
+            date=self.date,
+            is_finished=self.completed,
+            vandy_team=vandy_team,
+            vandy_score=self.vandy_score,
+            opponent=self.opponent,
+            opponent_score=self.opponent_score,
+        )
+
+
 # Abstraction for different Vandy teams to get their results
 class Team(metaclass=ABCMeta):
 
@@ -35,3 +68,38 @@ class Team(metaclass=ABCMeta):
 
     def has_match_in_message(self, message: str) -> bool:
         raise NotImplementedError()
+
+
+def get_latest_results(
+    teams: Sequence[Team],
+    desired_date: arrow.Arrow,
+    timeout: float | None = None,
+) -> list[VandyResult | None]:
+    """
+    Fetch the latest result for each of the teams at the same time.  Teams that
+    fail or don't finish before the deadline get None.
+    :param teams: the teams to look up
+    :param desired_date: the date to check the score from
+    :param timeout: how long to wait for all the results, TEAM_RESULT_TIMEOUT by default
+    :return: the results, in the same order as the teams
+    """
+    futures = [
+        _team_executor.submit(team.get_latest_result, desired_date) for team in teams
+    ]
+    if timeout is None:
+        timeout = settings.TEAM_RESULT_TIMEOUT
+    deadline = time.monotonic() + timeout
+
+    results: list[VandyResult | None] = []
+    for team, future in zip(teams, futures):
+        try:
+            results.append(future.result(max(deadline - time.monotonic(), 0)))
+        except FutureTimeoutError:
+            # Let it keep going, it'll probably get cached for next time
+            logger.warning("Timed out waiting on results for %s", team.name)
+            results.append(None)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # One team's scraper breaking shouldn't take the others down with it
+            logger.warning("Failed to get results for %s", team.name, exc_info=e)
+            results.append(None)
+    return results
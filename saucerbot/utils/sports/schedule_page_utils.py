@@ -1,29 +1,41 @@
+import bisect
+import datetime
 import json
 import logging
-from typing import List, Optional
+from collections.abc import Iterable
+from typing import List, NamedTuple, Optional
 
 import arrow
-import requests
 
-from saucerbot.utils.time_utils import get_date_from_string
+from saucerbot.utils import http
+from saucerbot.utils.sports import cache as sports_cache
+from saucerbot.utils.sports.models import ScheduleEvent
+from saucerbot.utils.time_utils import CENTRAL_TIME, get_date_from_string
 
 logger = logging.getLogger(__name__)
 
 # different strategy here, just gonna pull the whole schedule and read the page config rather than try to get it by date
 # probably could do the scoreboard way, but football has its whole week calculation nonsense; this seemed easier
-SCHEDULE_PAGE_START_MARKER = "window['__espnfitt__']"
+SCHEDULE_PAGE_START_MARKER = b"window['__espnfitt__']"
+TEAM_SCHEDULE_KEY = b'"teamSchedule":'
+
+_decoder = json.JSONDecoder()
 
 # It checks for a User-Agent, so whatever, I'll lie to ESPN
 HEADERS_FOR_ESPN = {"Accept": "*/*", "User-Agent": "curl/8.7.1"}
 
 
-def get_schedule_page_results(url: str, desired_date: arrow.Arrow) -> dict | None:
+def get_schedule_page_results(
+    url: str, desired_date: arrow.Arrow
+) -> ScheduleEvent | None:
     try:
         logger.info(f"Retrieving latest event from schedule page: {url}")
-        schedule = read_schedule_events(request_schedule_page(url))
-        most_recent = find_most_recent_event(schedule, desired_date)
+        schedule = sports_cache.get_or_fetch(
+            url, lambda: read_season_schedule(request_schedule_page(url)), schedule_ttl
+        )
+        most_recent = schedule.latest_on_or_before(desired_date.date())
         if most_recent:
-            logger.info(f"Found most recent event with date {str(most_recent['date'])}")
+            logger.info(f"Found most recent event with date {str(most_recent.date)}")
         else:
             logger.info("No recent events found")
         return most_recent
@@ -32,8 +44,52 @@ def get_schedule_page_results(url: str, desired_date: arrow.Arrow) -> dict | Non
         return None
 
 
-def request_schedule_page(url: str) -> str:
-    response = requests.get(url, headers=HEADERS_FOR_ESPN)
+class SeasonSchedule(NamedTuple):
+    """
+    A team's events, sorted by date so lookups can bisect
+    """
+
+    dates: tuple[datetime.date, ...]
+    events: tuple[ScheduleEvent, ...]
+
+    @classmethod
+    def from_events(cls, events: Iterable[ScheduleEvent]) -> "SeasonSchedule":
+        sorted_events = tuple(sorted(events, key=lambda x: x.date))
+        return cls(tuple(event.date for event in sorted_events), sorted_events)
+
+    def latest_on_or_before(
+        self, desired_date: datetime.date
+    ) -> Optional[ScheduleEvent]:
+        """
+        The last event on or before the date (if there's more than one that day,
+        the last one of those)
+        """
+        index = bisect.bisect_right(self.dates, desired_date)
+        return self.events[index - 1] if index > 0 else None
+
+    def next_after(self, desired_date: datetime.date) -> Optional[ScheduleEvent]:
+        """
+        The first event after the date
+        """
+        index = bisect.bisect_right(self.dates, desired_date)
+        return self.events[index] if index < len(self.events) else None
+
+
+def schedule_ttl(schedule: SeasonSchedule) -> float:
+    """
+    Check back often while there's a game going, and hardly at all once the season's done
+    """
+    today = arrow.now(CENTRAL_TIME).date()
+    pending = [event for event in schedule.events if not event.completed]
+    if not pending:
+        return sports_cache.FINAL_TTL
+    if any(event.date <= today for event in pending):
+        return sports_cache.LIVE_TTL
+    return sports_cache.UPCOMING_TTL
+
+
+def request_schedule_page(url: str) -> bytes:
+    response = http.get(url, headers=HEADERS_FOR_ESPN)
     if not (200 <= response.status_code < 300):
         logger.warning(
             "Received non-success response code: %i -- %s",
@@ -43,42 +99,37 @@ def request_schedule_page(url: str) -> str:
         raise Exception(
             f"Failed to request basketball data from ESPN: {response.status_code}"
         )
-    return response.text
+    # Skip decoding the whole page, we only need a little bit of it
+    return response.content
 
 
 def find_most_recent_event(
-    events: List[dict], desired_date: arrow.Arrow
-) -> Optional[dict]:
-    desired_date_casted = (
-        desired_date.date()
-    )  # make the types match, and just get the date info
-    sorted_events = sorted(events, key=lambda x: x["date"])
-    if desired_date_casted < sorted_events[0]["date"]:
-        return None
-    latest_match = sorted_events[0]
-    # binary search is for nerds
-    for event in sorted_events[1:]:
-        if event["date"] > desired_date_casted:
-            return latest_match
-        else:
-            latest_match = event
-    return latest_match
+    events: List[ScheduleEvent], desired_date: arrow.Arrow
+) -> Optional[ScheduleEvent]:
+    # turns out binary search isn't just for nerds
+    return SeasonSchedule.from_events(events).latest_on_or_before(desired_date.date())
 
 
-def read_schedule_events(response_text: str) -> List[dict]:
-    data = __retrieve_basketball_json(response_text)
-    seasons = data["page"]["content"]["scheduleData"]["teamSchedule"]
+def read_season_schedule(response_text: str | bytes) -> SeasonSchedule:
+    return SeasonSchedule.from_events(read_schedule_events(response_text))
+
+
+def read_schedule_events(response_text: str | bytes) -> List[ScheduleEvent]:
+    seasons = __retrieve_team_schedule(response_text)
     return [event for season in seasons for event in __read_events(season)]
 
 
-def __read_events(season: dict) -> List[dict]:
-    def parse_event(event: dict) -> dict:
-        return {
-            "opponent": event["opponent"],
-            "date": get_date_from_string(event["date"]["date"]),
-            "result": event["result"],
-            "status": event["status"],
-        }
+def __read_events(season: dict) -> List[ScheduleEvent]:
+    def parse_event(event: dict) -> ScheduleEvent:
+        result = event["result"]
+        # no guarantee that there are scores
+        return ScheduleEvent(
+            date=get_date_from_string(event["date"]["date"]),
+            opponent=event["opponent"]["displayName"],
+            vandy_score=int(result.get("currentTeamScore", -1)),
+            opponent_score=int(result.get("opponentTeamScore", -1)),
+            completed=event["status"]["completed"],
+        )
 
     event_map = season["events"]
     event_list = []
@@ -90,13 +141,37 @@ def __read_events(season: dict) -> List[dict]:
 
 
 # yeah it's not as elegant as consuming an API but whatever I'm lazy
-def __retrieve_basketball_json(response_text: str) -> dict:
-    start = response_text.index(SCHEDULE_PAGE_START_MARKER)
-    true_start = response_text.index("{", start)
-    end = response_text.index("</script>", start)
-    true_end = response_text.rindex("}", start, end)
+def __retrieve_basketball_json(response_text: str | bytes) -> dict:
+    page = response_text.encode() if isinstance(response_text, str) else response_text
+
+    start = page.index(SCHEDULE_PAGE_START_MARKER)
+    true_start = page.index(b"{", start)
+    end = page.index(b"</script>", start)
+    true_end = page.rindex(b"}", start, end)
 
     logger.debug(
         f"Thinking we have the start of basketball data at {true_start} and the end at {true_end}"
     )
-    return json.loads(response_text[true_start : true_end + 1])
+    return json.loads(page[true_start : true_end + 1])
+
+
+def __retrieve_team_schedule(response_text: str | bytes) -> list[dict]:
+    """
+    Pull just the team schedule out of the page config.  We only decode the
+    schedule itself and let the json scanner stop at the end of it, rather than
+    parsing the whole thing.
+    """
+    page = response_text.encode() if isinstance(response_text, str) else response_text
+
+    start = page.find(SCHEDULE_PAGE_START_MARKER)
+    end = page.find(b"</script>", start)
+    key = page.find(TEAM_SCHEDULE_KEY, start, end) if start >= 0 else -1
+    if key >= 0:
+        schedule_json = page[key + len(TEAM_SCHEDULE_KEY) : end].decode().lstrip()
+        try:
+            return _decoder.raw_decode(schedule_json)[0]
+        except json.JSONDecodeError:
+            logger.debug("Couldn't decode just the team schedule, reading it all")
+
+    data = __retrieve_basketball_json(page)
+    return data["page"]["content"]["scheduleData"]["teamSchedule"]
@@ -6,10 +6,11 @@ import sys
 from typing import List, Tuple
 
 import arrow
+from django.conf import settings
 
 from saucerbot.utils.sports.basketball import MensBasketball, WomensBasketball
 from saucerbot.utils.sports.football import VandyFootball
-from saucerbot.utils.sports.models import Team, VandyResult
+from saucerbot.utils.sports.models import Team, VandyResult, get_latest_results
 from saucerbot.utils.time_utils import CENTRAL_TIME
 
 logger = logging.getLogger(__name__)
@@ -76,7 +77,7 @@ def did_the_dores_win(
         desired_date = arrow.now(CENTRAL_TIME)
 
     teams = determine_teams_for_lookup(message, desired_date)
-    team_results = [team.get_latest_result(desired_date) for team in teams]
+    team_results = get_team_results(teams, desired_date)
     filtered_team_results = filter_team_results(team_results, desired_date)
 
     if len(filtered_team_results) == 0:
@@ -87,6 +88,22 @@ def did_the_dores_win(
     return build_message_response(sorted_team_results)
 
 
+def get_team_results(
+    teams: list[Team], desired_date: arrow.Arrow
+) -> list[VandyResult | None]:
+    if settings.GAME_RESULTS_FROM_DB:
+        # The refreshscores command keeps these up to date
+        # pylint: disable=import-outside-toplevel
+        from saucerbot.core.models import GameResult
+
+        stored = GameResult.objects.latest_results(
+            [team.name for team in teams], desired_date.date()
+        )
+        return [stored.get(team.name) for team in teams]
+
+    return get_latest_results(teams, desired_date)
+
+
 def determine_teams_for_lookup(
     message: str | None, desired_date: arrow.Arrow
 ) -> list[Team]:
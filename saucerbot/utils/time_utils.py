@@ -1,9 +1,19 @@
 import datetime
+from zoneinfo import ZoneInfo
 
 import arrow
 
 CENTRAL_TIME = "US/Central"
 
+_CENTRAL_ZONE = ZoneInfo(CENTRAL_TIME)
+
 
 def get_date_from_string(date: str) -> datetime.date:
-    return arrow.get(date).to(CENTRAL_TIME).date()
+    try:
+        # Much quicker than arrow for the ISO 8601 dates ESPN gives us
+        parsed = datetime.datetime.fromisoformat(date)
+    except ValueError:
+        return arrow.get(date).to(CENTRAL_TIME).date()
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.astimezone(_CENTRAL_ZONE).date()
@@ -169,6 +169,17 @@ def setup_bot(db, gmi, monkeypatch):
     return bot
 
 
+@pytest.fixture(name="handler_set_cache")
+def setup_handler_set_cache(settings):
+    """
+    Cache handler sets, in the (otherwise unused) locmem cache
+    """
+    from django.core.cache import caches
+
+    settings.HANDLER_SET_CACHE = "default"
+    caches["default"].clear()
+
+
 @pytest.fixture(scope="function")
 def event_loop(request: pytest.FixtureRequest) -> Iterator[AbstractEventLoop]:
     loop = asyncio.get_event_loop_policy().new_event_loop()
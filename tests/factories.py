@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Builders for fake ESPN responses, shared by the tests and the benchmarks.
+Nothing in here needs django.
+"""
+
+
+def make_scoreboard_team(i: int, location: str) -> dict:
+    return {
+        "id": i,
+        "uid": f"s:20~l:23~t:{i}",
+        "location": location,
+        "name": "Team",
+        "abbreviation": "TM",
+        "displayName": f"{location} Team",
+        "shortDisplayName": location,
+        "isActive": True,
+    }
+
+
+def make_scoreboard_event(i: int, home: str, away: str) -> dict:
+    status = {
+        "clock": 0.0,
+        "displayClock": "0:00",
+        "period": 4,
+        "type": {"completed": True},
+    }
+    competitors = [
+        (i * 2, "home", True, home, 28),
+        (i * 2 + 1, "away", False, away, 14),
+    ]
+    return {
+        "id": i,
+        "uid": f"s:20~l:23~e:{i}",
+        "date": "2024-09-07T16:00Z",
+        "name": f"{away} at {home}",
+        "shortName": "A @ H",
+        "season": {"type": 2, "year": 2024},
+        "week": {"number": 2},
+        "competitions": [
+            {
+                "id": i,
+                "uid": f"s:20~l:23~e:{i}~c:{i}",
+                "date": "2024-09-07T16:00Z",
+                "competitors": [
+                    {
+                        "id": team_id,
+                        "uid": f"s:20~l:23~t:{team_id}",
+                        "type": "team",
+                        "homeAway": home_away,
+                        "winner": winner,
+                        "team": make_scoreboard_team(team_id, location),
+                        "score": score,
+                    }
+                    for team_id, home_away, winner, location, score in competitors
+                ],
+                "status": status,
+            }
+        ],
+        "status": status,
+    }
@@ -10,9 +10,10 @@ logger = logging.getLogger(__name__)
 
 
 def test_like_if(bot, monkeypatch):
-    # Mock get_todays_events to avoid network calls
+    # Mock get_todays_events_with_times to avoid network calls
     monkeypatch.setattr(
-        "saucerbot.groupme.management.commands.remind.get_todays_events", lambda: []
+        "saucerbot.groupme.management.commands.remind.get_todays_events_with_times",
+        lambda: [],
     )
 
     execute_from_command_line(
@@ -24,6 +25,28 @@ def test_like_if(bot, monkeypatch):
     assert messages[0].text == LIKE_IF_POST
 
 
+def test_like_if_todays_events(bot, monkeypatch):
+    events = [
+        {"name": "Disney On Ice", "details": "https://e.com/1", "time": "1:00"},
+        {"name": "Flames vs. Predators", "details": "https://e.com/2", "time": "7:00"},
+    ]
+    monkeypatch.setattr(
+        "saucerbot.groupme.management.commands.remind.get_todays_events_with_times",
+        lambda: events,
+    )
+
+    execute_from_command_line(
+        ["manage.py", "remind", "saucerbot", "--force", "like-if"]
+    )
+
+    # One reminder for each of today's events
+    messages = bot.group.messages.all()
+    assert len(messages) == 3
+    assert messages[0].text == LIKE_IF_POST
+    assert "1:00" in messages[1].text
+    assert "7:00" in messages[2].text
+
+
 def test_whos_coming(bot, gmi):
     from lowerpines.endpoints.member import Member
 
@@ -106,3 +129,164 @@ def test_whos_coming_missing_users(bot):
     assert bot.group.messages.count == 2
     assert bot.group.messages.all()[0].text == LIKE_IF_POST
     assert bot.group.messages.all()[1].text == "Looks like 3 people are coming tonight."
+
+
+def test_refreshscores(bot, monkeypatch):
+    from unittest.mock import Mock
+
+    import arrow
+
+    from saucerbot.core.models import GameResult
+    from saucerbot.utils.sports.models import Team, VandyResult
+
+    team = Mock(Team)
+    team.name = "Vandy Football"
+    team.is_in_season.return_value = True
+    team.get_latest_result.return_value = VandyResult(
+        date=arrow.now().date(),
+        is_finished=False,
+        vandy_team="Vandy Football",
+        vandy_score=14,
+        opponent="Tennessee",
+        opponent_score=0,
+    )
+    monkeypatch.setattr(
+        "saucerbot.core.management.commands.refreshscores.VANDY_TEAMS", [team]
+    )
+
+    execute_from_command_line(["manage.py", "refreshscores", "--bot", "saucerbot"])
+
+    game = GameResult.objects.get()
+    assert not game.is_finished
+    assert bot.group.messages.count == 0
+
+    team.get_latest_result.return_value = (
+        team.get_latest_result.return_value.model_copy(
+            update={"is_finished": True, "vandy_score": 28}
+        )
+    )
+
+    execute_from_command_line(["manage.py", "refreshscores", "--bot", "saucerbot"])
+    execute_from_command_line(["manage.py", "refreshscores", "--bot", "saucerbot"])
+
+    game = GameResult.objects.get()
+    assert game.is_finished
+    assert game.vandy_score == 28
+
+    # Only posted when it went final
+    assert bot.group.messages.count == 1
+    assert "28-0" in bot.group.messages.all()[0].text
+
+
+def test_refreshscores_first_seen_final(bot, monkeypatch):
+    from unittest.mock import Mock
+
+    import arrow
+
+    from saucerbot.core.models import GameResult
+    from saucerbot.utils.sports.models import Team, VandyResult
+
+    team = Mock(Team)
+    team.name = "Vandy Football"
+    team.is_in_season.return_value = True
+    team.get_latest_result.return_value = VandyResult(
+        date=arrow.now("US/Central").shift(days=-1).date(),
+        is_finished=True,
+        vandy_team="Vandy Football",
+        vandy_score=35,
+        opponent="Kentucky",
+        opponent_score=7,
+    )
+    monkeypatch.setattr(
+        "saucerbot.core.management.commands.refreshscores.VANDY_TEAMS", [team]
+    )
+
+    # Yesterday's game is old news
+    execute_from_command_line(["manage.py", "refreshscores", "--bot", "saucerbot"])
+    assert GameResult.objects.get().is_finished
+    assert bot.group.messages.count == 0
+
+    # But one that ended today gets posted, even though it was never seen in progress
+    team.get_latest_result.return_value = (
+        team.get_latest_result.return_value.model_copy(
+            update={"date": arrow.now("US/Central").date(), "opponent": "Tennessee"}
+        )
+    )
+    execute_from_command_line(["manage.py", "refreshscores", "--bot", "saucerbot"])
+    execute_from_command_line(["manage.py", "refreshscores", "--bot", "saucerbot"])
+
+    assert GameResult.objects.count() == 2
+    assert bot.group.messages.count == 1
+    assert "35-7" in bot.group.messages.all()[0].text
+
+
+def test_scrapebridgestone(db, settings, monkeypatch):
+    import arrow
+
+    from saucerbot.core.models import BridgestoneEvent
+    from saucerbot.utils.bridgestone import get_todays_events_with_times
+
+    today = arrow.now("US/Central").date()
+    listing = [
+        {"details": "https://e.com/1", "name": "WWE", "date": "Oct 4"},
+        {"details": "https://e.com/2", "name": "Blake Shelton", "date": "Sep 9"},
+    ]
+    fetched: list[str] = []
+
+    def get_all_events(_):
+        return [dict(event, parsed_date=today) for event in listing]
+
+    def get_event_times(events):
+        fetched.extend(event["details"] for event in events)
+        return ["7:00" for _ in events]
+
+    command = "saucerbot.core.management.commands.scrapebridgestone"
+    monkeypatch.setattr(f"{command}.get_all_events", get_all_events)
+    monkeypatch.setattr(f"{command}.get_event_times", get_event_times)
+
+    execute_from_command_line(["manage.py", "scrapebridgestone"])
+    assert BridgestoneEvent.objects.count() == 2
+    assert fetched == ["https://e.com/1", "https://e.com/2"]
+
+    # Nothing changed, so no event pages get fetched
+    execute_from_command_line(["manage.py", "scrapebridgestone"])
+    assert len(fetched) == 2
+
+    listing[1]["name"] = "RESCHEDULED: Blake Shelton"
+    execute_from_command_line(["manage.py", "scrapebridgestone"])
+    assert fetched[2:] == ["https://e.com/2"]
+    assert BridgestoneEvent.objects.count() == 2
+
+    # Cancelled events go away, but ones that already happened stick around
+    past = BridgestoneEvent.objects.create(
+        details="https://e.com/0",
+        name="Last week",
+        date=arrow.now("US/Central").shift(days=-7).date(),
+        time="7:00",
+        content_hash="",
+    )
+    listing.append({"details": "https://e.com/3", "name": "Cancelled", "date": "Oct 9"})
+    execute_from_command_line(["manage.py", "scrapebridgestone"])
+    assert BridgestoneEvent.objects.filter(details="https://e.com/3").exists()
+    listing.pop()
+    execute_from_command_line(["manage.py", "scrapebridgestone"])
+    assert not BridgestoneEvent.objects.filter(details="https://e.com/3").exists()
+    assert BridgestoneEvent.objects.filter(pk=past.pk).exists()
+
+    # A listing that comes back empty doesn't wipe everything out
+    saved_listing = list(listing)
+    listing.clear()
+    execute_from_command_line(["manage.py", "scrapebridgestone"])
+    assert BridgestoneEvent.objects.count() == 3
+    listing.extend(saved_listing)
+
+    # Today's events come straight out of the table, times and all
+    settings.BRIDGESTONE_EVENTS_FROM_DB = True
+    monkeypatch.setattr("saucerbot.utils.bridgestone.get_event_times", get_event_times)
+    todays_events = get_todays_events_with_times()
+    assert [event["name"] for event in todays_events] == [
+        "WWE",
+        "RESCHEDULED: Blake Shelton",
+    ]
+    assert [event["time"] for event in todays_events] == ["7:00", "7:00"]
+    assert len(fetched) == 4
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
 from datetime import timedelta
 
 import arrow
@@ -11,6 +12,9 @@ import pytest
 async def test_ready(discord_client):
     await discord_client.on_ready()
 
+    # Guilds get loaded as they become available, not all over again here
+    assert not discord_client.stored_guilds
+
 
 @pytest.mark.asyncio
 async def test_basic_message(discord_client):
@@ -99,3 +103,154 @@ async def test_whoami_long(db):
     assert second_message.endswith(second_expected_end)
 
     await HistoricalDisplayName.objects.all().adelete()
+
+
+@pytest.mark.asyncio
+async def test_default_handler_message(discord_client, db):
+    discord_client.loop = asyncio.get_running_loop()
+
+    await dpytest.message("anchor down")
+
+    # Sync handlers run on the executor, let their posts land
+    await dpytest.run_all_events()
+    await asyncio.sleep(0.1)
+
+    assert dpytest.verify().message().content("GO DORES")
+
+
+@pytest.mark.asyncio
+async def test_channel_lookups_cached(
+    discord_client, db, handler_set_cache, monkeypatch
+):
+    from saucerbot.core.handler_sets import handler_sets
+    from saucerbot.discord.models import Channel, Guild
+
+    discord_client.loop = asyncio.get_running_loop()
+
+    config = dpytest.get_config()
+    guild = config.guilds[0]
+    channel = config.channels[0]
+
+    # Something's already stored for the guild, it gets loaded up front
+    s_guild = await Guild.objects.acreate(guild_id=guild.id, name=guild.name)
+    s_channel = await Channel.objects.acreate(
+        guild=s_guild, channel_id=channel.id, name=channel.name
+    )
+    await s_channel.handlers.acreate(handler_name="anchor_down")
+    handler_sets.invalidate("discord", str(channel.id))
+
+    await discord_client.on_guild_available(guild)
+    assert discord_client.stored_guilds[guild.id].pk == s_guild.pk
+    assert discord_client.stored_channels[channel.id].pk == s_channel.pk
+    assert handler_sets.get("discord", str(channel.id)) == {"anchor_down"}
+
+    def no_lookups(*args, **kwargs):
+        raise AssertionError("Should have been cached")
+
+    monkeypatch.setattr(Guild.objects, "aget_or_create", no_lookups)
+    monkeypatch.setattr(Channel.objects, "select_related", no_lookups)
+    monkeypatch.setattr(Channel.objects, "acreate", no_lookups)
+
+    await dpytest.message("anchor down")
+    await dpytest.run_all_events()
+    await asyncio.sleep(0.1)
+    assert dpytest.verify().message().content("GO DORES")
+
+    # Renames get saved as they happen
+    await discord_client.on_guild_channel_update(channel, channel)
+    channel.name = "renamed"
+    await discord_client.on_guild_channel_update(channel, channel)
+    assert (await Channel.objects.aget(pk=s_channel.pk)).name == "renamed"
+
+    await discord_client.on_guild_channel_delete(channel)
+    assert channel.id not in discord_client.stored_channels
+
+
+@pytest.mark.asyncio
+async def test_deleted_channel_recreated(discord_client, db, handler_set_cache):
+    from saucerbot.discord.models import Channel, Guild
+
+    discord_client.loop = asyncio.get_running_loop()
+
+    guild = dpytest.get_config().guilds[0]
+    channel = dpytest.get_config().channels[0]
+
+    s_guild = await Guild.objects.acreate(guild_id=guild.id, name=guild.name)
+    await Channel.objects.acreate(
+        guild=s_guild, channel_id=channel.id, name=channel.name
+    )
+    await discord_client.on_guild_available(guild)
+
+    # Deleted through the API (or the admin), including the whole guild
+    await Guild.objects.filter(pk=s_guild.pk).adelete()
+
+    await dpytest.message("anchor down")
+    await dpytest.run_all_events()
+    await asyncio.sleep(0.1)
+    assert dpytest.verify().message().content("GO DORES")
+
+    s_channel = await Channel.objects.select_related("guild").aget(
+        channel_id=channel.id
+    )
+    assert discord_client.stored_channels[channel.id].pk == s_channel.pk
+    assert discord_client.stored_guilds[guild.id].pk == s_channel.guild.pk
+    assert "anchor_down" in await s_channel.load_handler_names()
+
+
+@pytest.mark.asyncio
+async def test_handlers_loaded_without_default_executor(
+    discord_client, db, handler_set_cache
+):
+    from saucerbot.core.handler_sets import handler_sets
+    from saucerbot.handlers import registry
+
+    loop = asyncio.get_running_loop()
+    discord_client.loop = loop
+
+    channel = dpytest.get_config().channels[0]
+    handler_sets.invalidate("discord", str(channel.id))
+
+    run_in_executor = loop.run_in_executor
+
+    def no_default_executor(executor, *args):
+        # Sync handlers go to the registry's pool and the async ORM uses its own
+        assert executor is not None
+        return run_in_executor(executor, *args)
+
+    loop.run_in_executor = no_default_executor  # type: ignore[method-assign]
+
+    await dpytest.message("anchor down")
+    await dpytest.run_all_events()
+    await asyncio.sleep(0.1)
+
+    assert dpytest.verify().message().content("GO DORES")
+    assert handler_sets.get("discord", str(channel.id))
+    assert registry.executor.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_add_defaults_with_db_cache(discord_client, db, settings):
+    from django.core.management import call_command
+
+    from saucerbot.core.handler_sets import handler_sets
+    from saucerbot.discord.models import Channel, Guild
+
+    settings.CACHES = {
+        **settings.CACHES,
+        "db": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "saucerbot_cache",
+        },
+    }
+    settings.HANDLER_SET_CACHE = "db"
+    await asyncio.to_thread(call_command, "createcachetable")
+
+    guild = await Guild.objects.acreate(guild_id="1", name="guild")
+    channel = await Channel.objects.acreate(guild=guild, channel_id="2", name="c")
+    await handler_sets.aset("discord", "2", [])
+
+    # This is on the event loop, so it can't touch the cache table synchronously
+    await channel.add_defaults()
+
+    assert await handler_sets.aget("discord", "2") is None
+    assert "anchor_down" in await channel.load_handler_names()
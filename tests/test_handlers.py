@@ -9,6 +9,7 @@ from datetime import timedelta
 from pathlib import Path
 
 import arrow
+import pytest
 
 logger = logging.getLogger(__name__)
 
@@ -650,3 +651,121 @@ def test_barely_know_her_discord(monkeypatch):
     assert isinstance(quip, str)
     assert "<@987654321>" in quip, "Expected Discord mention format in quip"
     assert "deliver" in quip.lower() or "package" in quip.lower()
+
+
+def test_async_callback(bot, client, settings, monkeypatch):
+    from saucerbot.core.dispatch import BackgroundDispatcher
+
+    settings.GROUPME_ASYNC_CALLBACKS = True
+    dispatcher = BackgroundDispatcher("test-dispatch", 1, 10)
+    monkeypatch.setattr("saucerbot.groupme.views.callback_dispatcher", dispatcher)
+
+    bot.handlers.create(handler_name="zo_is_dead")
+
+    sample_message = get_sample_message(bot.bot, "zo")
+
+    ret = client.post(
+        "/api/groupme/bots/saucerbot/callback/",
+        content_type="application/json",
+        data=json.dumps(sample_message),
+    )
+
+    assert ret.status_code == 200
+    assert ret.json() == {"queued": True}
+
+    # Wait for the handlers to finish
+    dispatcher.shutdown()
+
+    assert dispatcher.queue_depth == 0
+    assert bot.group.messages.count == 1
+    assert bot.group.messages.all()[0].text == ZO_EXPECTED_POST
+
+
+def test_async_callback_queue_full(bot, client, settings, monkeypatch):
+    from saucerbot.core.dispatch import BackgroundDispatcher
+
+    settings.GROUPME_ASYNC_CALLBACKS = True
+    dispatcher = BackgroundDispatcher("test-dispatch", 1, 0)
+    monkeypatch.setattr("saucerbot.groupme.views.callback_dispatcher", dispatcher)
+
+    bot.handlers.create(handler_name="zo_is_dead")
+
+    sample_message = get_sample_message(bot.bot, "zo")
+
+    ret = client.post(
+        "/api/groupme/bots/saucerbot/callback/",
+        content_type="application/json",
+        data=json.dumps(sample_message),
+    )
+
+    # Falls back to running in the foreground
+    assert ret.status_code == 200
+    assert ret.json() == {"matched_handlers": ["zo_is_dead"]}
+    assert bot.group.messages.count == 1
+
+
+def test_dispatcher_refuses_work_after_shutdown(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from saucerbot.core.dispatch import BackgroundDispatcher
+
+    dispatcher = BackgroundDispatcher("test-dispatch", 1, 10)
+    dispatcher.shutdown()
+    assert dispatcher.submit(print) is None
+
+    # The executor itself can refuse too (like when the interpreter is exiting)
+    dispatcher = BackgroundDispatcher("test-dispatch", 1, 10)
+
+    def refuse(*args, **kwargs):
+        raise RuntimeError("cannot schedule new futures after shutdown")
+
+    monkeypatch.setattr(ThreadPoolExecutor, "submit", refuse)
+    assert dispatcher.submit(print) is None
+    assert dispatcher.queue_depth == 0
+
+
+def test_dispatcher_reports_failures(monkeypatch):
+    from saucerbot.core.dispatch import BackgroundDispatcher
+
+    reported = []
+    monkeypatch.setattr(
+        "rollbar.report_exc_info", lambda *args, **kwargs: reported.append(args)
+    )
+
+    def fail():
+        raise ValueError("handler blew up")
+
+    dispatcher = BackgroundDispatcher("test-dispatch", 1, 10)
+    future = dispatcher.submit(fail)
+    assert future is not None
+
+    with pytest.raises(ValueError):
+        future.result(timeout=5)
+    dispatcher.shutdown()
+
+    assert len(reported) == 1
+
+
+def test_metered_executor():
+    import threading
+
+    from saucerbot.core.dispatch import MeteredExecutor, QueueFull
+
+    executor = MeteredExecutor(1, "test-handlers", max_queue=3)
+    release = threading.Event()
+
+    futures = [executor.submit(release.wait, 5) for _ in range(3)]
+    assert executor.queue_depth == 3
+    assert executor.waiting == 2
+
+    with pytest.raises(QueueFull):
+        executor.submit(release.wait, 5)
+    assert executor.queue_depth == 3
+
+    release.set()
+    for future in futures:
+        future.result()
+    executor.shutdown()
+
+    assert executor.queue_depth == 0
+    assert executor.waiting == 0
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def fake_send(sent, status_code=200):
+    def send(self, request, **kwargs):
+        sent.append(kwargs)
+        response = requests.Response()
+        response.status_code = status_code
+        response.url = request.url
+        response._content = b'{"fact": "cats"}'
+        return response
+
+    return send
+
+
+def test_default_timeout(monkeypatch, settings):
+    from saucerbot.utils import http
+
+    sent = []
+    monkeypatch.setattr(HTTPAdapter, "send", fake_send(sent))
+
+    assert http.get("https://example.com/fact").json() == {"fact": "cats"}
+    assert sent[0]["timeout"] == (3.05, 10)
+
+    http.get("https://example.com/fact", timeout=1)
+    assert sent[1]["timeout"] == 1
+
+    settings.HTTP_READ_TIMEOUT = 30
+    http.get("https://example.com/fact")
+    assert sent[2]["timeout"] == (3.05, 30)
+
+
+def test_latency_recorded(monkeypatch):
+    from saucerbot.utils import http
+
+    monkeypatch.setattr(HTTPAdapter, "send", fake_send([], status_code=500))
+
+    before = http.latency.get("latency.example.com")
+    assert before is None
+
+    http.get("https://latency.example.com/")
+    http.post("https://latency.example.com/")
+
+    stats = http.latency.get("latency.example.com")
+    assert stats.count == 2
+    assert stats.errors == 2
+    assert stats.max >= stats.mean >= 0
+
+
+def test_retries_idempotent_only():
+    from saucerbot.utils import http
+
+    retry = http.session.get_adapter("https://example.com").max_retries
+
+    assert retry.is_retry("GET", 503)
+    assert not retry.is_retry("POST", 503)
+    assert not retry.is_retry("GET", 404)
+
+
+@pytest.mark.asyncio
+async def test_async_retries_and_latency(monkeypatch):
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    from saucerbot.utils import http
+
+    monkeypatch.setattr(http, "BACKOFF_FACTOR", 0)
+    statuses = [503, 503, 200]
+    calls = []
+
+    async def handler(request):
+        calls.append(request.method)
+        return web.json_response({"fact": "cats"}, status=statuses[len(calls) - 1])
+
+    app = web.Application()
+    app.router.add_route("*", "/fact", handler)
+
+    async with TestServer(app, host="127.0.0.1") as server:
+        url = str(server.make_url("/fact"))
+        try:
+            response = await http.aget(url)
+            assert response.status_code == 200
+            assert response.json() == {"fact": "cats"}
+            assert calls == ["GET", "GET", "GET"]
+
+            # Posts don't get retried
+            statuses[:] = [200, 200, 200, 503]
+            response = await http.apost(url)
+            assert response.status_code == 503
+            assert calls == ["GET", "GET", "GET", "POST"]
+        finally:
+            await http.aclose()
+
+    stats = http.latency.get("127.0.0.1")
+    assert stats.count == 4
+    assert stats.errors == 3
+
+    # A new session gets made the next time around
+    assert asyncio.get_running_loop() not in http._async_sessions
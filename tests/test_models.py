@@ -100,3 +100,87 @@ def test_new_user_invalid(monkeypatch):
         new_user(fake_request, "abcdef")
 
     assert SESSION_KEY not in fake_request.session
+
+
+def test_bot_groupme_objects_cached(bot, monkeypatch):
+    from lowerpines.bot import BotManager
+
+    from saucerbot.groupme.models import Bot
+
+    lookups = []
+    original_get = BotManager.get
+
+    def counting_get(self, **kwargs):
+        lookups.append(kwargs)
+        return original_get(self, **kwargs)
+
+    monkeypatch.setattr(BotManager, "get", counting_get)
+
+    bot.clear_groupme_objects()
+
+    assert Bot.objects.get(pk=bot.pk).bot.bot_id == bot.bot_id
+    assert Bot.objects.get(pk=bot.pk).bot.bot_id == bot.bot_id
+    assert len(lookups) == 1
+
+    bot.clear_groupme_objects()
+
+    assert Bot.objects.get(pk=bot.pk).bot.bot_id == bot.bot_id
+    assert len(lookups) == 2
+
+
+def test_resolve_webhook(bot, django_assert_num_queries):
+    from saucerbot.groupme.models import Bot
+
+    bot.handlers.create(handler_name="zo_is_dead")
+    bot.handlers.create(handler_name="whoami")
+
+    other = Bot.objects.create(
+        owner=bot.owner, bot_id="other", group_id=bot.group_id, name="otherbot"
+    )
+    other.handlers.create(handler_name="mars")
+
+    with django_assert_num_queries(1):
+        resolved = Bot.objects.resolve_webhook("saucerbot")
+
+        assert resolved.pk == bot.pk
+        assert resolved.owner.pk == bot.owner.pk
+        assert resolved.handler_names == {"zo_is_dead", "whoami"}
+        assert resolved.group_bot_names == {"saucerbot", "otherbot"}
+
+    with pytest.raises(Bot.DoesNotExist):
+        Bot.objects.resolve_webhook("missing")
+
+
+def test_handler_names_invalidated(bot, handler_set_cache, django_assert_num_queries):
+    from saucerbot.groupme.models import Bot
+
+    bot.handlers.create(handler_name="zo_is_dead")
+
+    assert Bot.objects.resolve_webhook("saucerbot").handler_names == {"zo_is_dead"}
+
+    # Cached now, so we don't need the handlers anymore
+    with django_assert_num_queries(1):
+        assert Bot.objects.get(pk=bot.pk).handler_names == {"zo_is_dead"}
+
+    bot.handlers.create(handler_name="whoami")
+
+    assert Bot.objects.resolve_webhook("saucerbot").handler_names == {
+        "zo_is_dead",
+        "whoami",
+    }
+
+    bot.handlers.filter(handler_name="zo_is_dead").delete()
+
+    assert Bot.objects.get(pk=bot.pk).handler_names == {"whoami"}
+
+
+def test_handler_names_not_cached_per_process(bot, django_assert_num_queries):
+    from saucerbot.groupme.models import Bot
+
+    bot.handlers.create(handler_name="zo_is_dead")
+
+    assert Bot.objects.resolve_webhook("saucerbot").handler_names == {"zo_is_dead"}
+
+    # Without a shared cache, another worker's changes have to show up right away
+    with django_assert_num_queries(2):
+        assert Bot.objects.get(pk=bot.pk).handler_names == {"zo_is_dead"}
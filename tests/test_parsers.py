@@ -2,7 +2,6 @@ from typing import Any
 
 import arrow
 import pytest
-from bs4 import BeautifulSoup
 
 from saucerbot.utils.bridgestone import (
     bridgestone_events_url,
@@ -11,8 +10,14 @@ from saucerbot.utils.bridgestone import (
     get_event_time_helper,
     get_events_for_date,
     get_year,
+    parse_event_date,
+)
+from saucerbot.utils.parsers import (
+    BridgestoneEventsParser,
+    BridgestoneEventTimeParser,
+    HtmlContentProvider,
+    Page,
 )
-from saucerbot.utils.parsers import HtmlContentProvider
 
 
 class LocalFileContentProvider(HtmlContentProvider):
@@ -20,10 +25,11 @@ class LocalFileContentProvider(HtmlContentProvider):
         super().__init__("")
         self.file_path = file_path
 
-    def get_content(self) -> BeautifulSoup:
-        with open(self.file_path, "r") as fp:
-            content = "".join(fp.readlines())
-            return BeautifulSoup(content, "html.parser")
+    def get_page(self) -> Page:
+        if not self.page:
+            with open(self.file_path, "r") as fp:
+                self.page = Page("".join(fp.readlines()))
+        return self.page
 
 
 def create_event(name: str, month: int, day: int) -> dict[str, Any]:
@@ -70,6 +76,71 @@ def test_event_list_parsing():
     assert event_equals(expected_events[4], dated_events[0])
 
 
+def test_event_calendar():
+    import datetime
+
+    from saucerbot.utils.bridgestone import EventCalendar
+
+    provider = LocalFileContentProvider("test_resources/events-sample.html")
+    calendar = EventCalendar(get_all_events(provider))
+    assert len(calendar) == len(expected_events)
+
+    year = get_year(9)
+    assert [ev["name"] for ev in calendar.on(datetime.date(year, 9, 23))] == [
+        "Disney On Ice: Dream Big"
+    ]
+    assert calendar.on(datetime.date(year, 9, 24)) == []
+
+    week = calendar.events_between(
+        datetime.date(year, 9, 21), datetime.date(year, 9, 28)
+    )
+    assert [ev["name"] for ev in week] == [
+        "Eric Clapton",
+        "Disney On Ice: Dream Big",
+        "Petey's Preds Party",
+    ]
+
+
+@pytest.mark.parametrize(
+    "date_str,expected",
+    [
+        ("Sep 03", (9, 3)),
+        ("June 12", (6, 12)),
+        ("Sept. 23 - 26", (9, 23)),
+        ("TBA", None),
+        ("Feb 30", None),
+    ],
+)
+def test_parse_event_date(date_str, expected):
+    import datetime
+
+    today = datetime.date(2021, 8, 1)
+    parsed = parse_event_date(date_str, today)
+    if expected is None:
+        assert parsed is None
+    else:
+        month, day = expected
+        assert parsed == datetime.date(get_year(month, today), month, day)
+
+
+@pytest.mark.parametrize(
+    "parser_class,file_path",
+    [
+        (BridgestoneEventsParser, "test_resources/events-sample.html"),
+        (BridgestoneEventTimeParser, "test_resources/event-time-sample.html"),
+    ],
+)
+def test_parser_backends_match(parser_class, file_path):
+    pytest.importorskip("lxml")
+    provider = LocalFileContentProvider(file_path)
+
+    soup_rows = list(parser_class(provider, backend="soup").parse())
+    lxml_rows = list(parser_class(provider, backend="lxml").parse())
+
+    assert soup_rows
+    assert lxml_rows == soup_rows
+
+
 def test_event_time_parsing():
     provider = LocalFileContentProvider("test_resources/event-time-sample.html")
     event_name = "Panthers vs. Predators"  # Doesn't really matter
@@ -95,3 +166,112 @@ def test_bridgestone_site_structure():
     selected_event = all_events[0]
     retrieved_time = get_event_time(selected_event)
     assert retrieved_time
+
+
+def test_pages_cached(monkeypatch, settings):
+    import requests
+
+    from saucerbot.utils import parsers
+
+    url = "https://example.com/events"
+    sent = []
+
+    def fake_get(url, headers=None, **kwargs):
+        sent.append(headers)
+        response = requests.Response()
+        response.url = url
+        if headers.get("If-None-Match") == '"v1"':
+            response.status_code = 304
+        else:
+            response.status_code = 200
+            response.headers["ETag"] = '"v1"'
+            response._content = b"<html><div id='list'>Events</div></html>"
+        return response
+
+    monkeypatch.setattr("saucerbot.utils.http.get", fake_get)
+    parsers.pages.delete(url)
+
+    soup = HtmlContentProvider(url).get_content()
+    assert soup.select_one("div#list").text == "Events"
+
+    # Still fresh, no request at all
+    assert HtmlContentProvider(url).get_content() is soup
+    assert len(sent) == 1
+
+    # Stale, but it didn't change so it doesn't get parsed again
+    settings.PAGE_FRESH_TTL = 0
+    assert HtmlContentProvider(url).get_content() is soup
+    assert len(sent) == 2
+    assert sent[1] == {"If-None-Match": '"v1"'}
+
+    parsers.pages.delete(url)
+
+
+def test_parser_selectors_compiled():
+    from saucerbot.utils.parsers import MissingBaseError, Parser
+
+    class EventsWithMissingFields(Parser):
+        base = BridgestoneEventsParser.base
+        fields = [
+            ("link", "h3 > a", None),
+            ("missing_link", "h4 > a", None),
+            ("missing_text", "span.nope", None),
+        ]
+
+    assert set(EventsWithMissingFields._backends) >= {"soup"}
+    assert EventsWithMissingFields._guessed_types == ["a", "a", "span.nope"]
+
+    provider = LocalFileContentProvider("test_resources/events-sample.html")
+    rows = list(EventsWithMissingFields(provider, backend="soup").parse())
+
+    assert len(rows) > 0
+    assert all(row["link"]["href"] for row in rows)
+    assert all(row["missing_link"] == {"text": "", "href": ""} for row in rows)
+    # empty strings get dropped
+    assert all("missing_text" not in row for row in rows)
+
+    class NoBase(Parser):
+        fields = [("link", "a", None)]
+
+    with pytest.raises(MissingBaseError):
+        list(NoBase(provider).parse())
+
+
+def test_todays_events_with_times(monkeypatch):
+    import threading
+
+    from saucerbot.utils import bridgestone
+
+    today = arrow.now("US/Central")
+    events = [
+        {"name": "Panthers vs. Predators", "details": "https://e.com/1"},
+        {"name": "WWE", "details": "https://e.com/2"},
+    ]
+    for event in events:
+        event["parsed_date"] = today
+        bridgestone.event_times.delete(event["details"])
+
+    # Both pages have to be fetched at once to get past this
+    barrier = threading.Barrier(len(events), timeout=5)
+    fetched = []
+
+    def create_provider(event):
+        barrier.wait()
+        fetched.append(event["details"])
+        return LocalFileContentProvider("test_resources/event-time-sample.html")
+
+    monkeypatch.setattr(bridgestone, "get_todays_events", lambda: events)
+    monkeypatch.setattr(
+        BridgestoneEventTimeParser, "create_event_time_provider", create_provider
+    )
+
+    todays_events = bridgestone.get_todays_events_with_times()
+    assert [event["time"] for event in todays_events] == ["7:00", "7:00"]
+    assert len(fetched) == 2
+
+    # Cached for the rest of the event
+    assert get_event_time(events[0]) == "7:00"
+    assert len(fetched) == 2
+
+    for event in events:
+        bridgestone.event_times.delete(event["details"])
@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+import arrow
+import pytest
+
+
+def get_test_message(text):
+    from saucerbot.handlers import Message
+
+    class TestMessage(Message):
+        user_id = "abcdef"
+        user_name = "Foo Bar"
+        content = text
+        created_at = arrow.utcnow()
+
+    return TestMessage()
+
+
+def get_test_context():
+    from saucerbot.handlers import BotContext
+
+    class TestContext(BotContext):
+        def __init__(self):
+            self.posts = []
+
+        def post(self, message):
+            self.posts.append(message)
+
+    return TestContext()
+
+
+def test_dispatch_index_candidates():
+    from saucerbot.handlers import HandlerRegistry
+
+    registry = HandlerRegistry()
+
+    @registry.handler(r"foo")
+    def foo(context):
+        context.post("foo")
+
+    @registry.handler([r"bar", r"baz"], case_sensitive=True)
+    def bar(context):
+        context.post("bar")
+
+    @registry.handler()
+    def plain(context, message):
+        return False
+
+    index = registry.dispatch_plan("groupme", frozenset({"foo", "bar"})).regex_index
+
+    assert index.candidates("nothing to see here") == set()
+    assert index.candidates("FOO") == {"foo"}
+    assert index.candidates("BAR") == set()
+    assert index.candidates("baz") == {"bar"}
+
+
+def test_dispatch_index_unindexed():
+    from saucerbot.handlers import HandlerRegistry
+
+    registry = HandlerRegistry()
+
+    @registry.handler(r"(a)\1")
+    def backref(context):
+        context.post("backref")
+
+    index = registry.dispatch_plan("discord", frozenset({"backref"})).regex_index
+
+    assert index.unindexed == {"backref"}
+    assert index.candidates("nothing to see here") == {"backref"}
+
+
+def test_dispatch_plan_rebuilt_on_register():
+    from saucerbot.handlers import HandlerRegistry
+
+    registry = HandlerRegistry()
+
+    @registry.handler(r"foo")
+    def foo(context):
+        context.post("foo")
+
+    names = frozenset({"foo", "bar"})
+
+    assert (
+        registry.dispatch_plan("groupme", names).regex_index.candidates("bar") == set()
+    )
+
+    @registry.handler(r"bar")
+    def bar(context):
+        context.post("bar")
+
+    plan = registry.dispatch_plan("groupme", names)
+    assert [h.name for h in plan.handlers] == ["foo", "bar"]
+    assert plan.regex_index.candidates("bar") == {"foo", "bar"}
+
+
+def test_handle_message_first_match():
+    from saucerbot.handlers import HandlerRegistry
+
+    registry = HandlerRegistry()
+
+    @registry.handler(r"foo")
+    def foo(context):
+        context.post("foo")
+
+    @registry.handler(r"bar")
+    def bar(context):
+        context.post("bar")
+
+    @registry.handler(always_run=True)
+    def always(context, message):
+        context.post("always")
+        return True
+
+    names = {"foo", "bar", "always"}
+
+    context = get_test_context()
+    matched = registry.handle_message(
+        "groupme", names, context, get_test_message("bar foo")
+    )
+    assert matched == ["foo", "always"]
+    assert context.posts == ["foo", "always"]
+
+    context = get_test_context()
+    matched = registry.handle_message(
+        "groupme", names, context, get_test_message("nothing")
+    )
+    assert matched == ["always"]
+    assert context.posts == ["always"]
+
+
+def test_invoker_kwargs():
+    from saucerbot.handlers import HandlerRegistry
+
+    registry = HandlerRegistry()
+
+    @registry.handler(r"f(o+)")
+    def foo(context, message, match):
+        context.post((message.content, match.group(1)))
+
+    @registry.handler(r"bar")
+    def bar(context, match):
+        context.post(match.group(0))
+
+    @registry.handler()
+    def plain(context, message):
+        context.post(message.content)
+        return False
+
+    context = get_test_context()
+    registry.handle_message(
+        "groupme", {"foo", "plain"}, context, get_test_message("fooo")
+    )
+    assert context.posts == [("fooo", "ooo")]
+
+    context = get_test_context()
+    registry.handle_message(
+        "groupme", {"foo", "plain"}, context, get_test_message("nope")
+    )
+    assert context.posts == ["nope"]
+
+    context = get_test_context()
+    registry.handle_message("groupme", {"bar"}, context, get_test_message("a bar"))
+    assert context.posts == ["bar"]
+
+    assert not registry.get(name="foo").is_coroutine
+
+
+def test_dispatch_plan_filtering():
+    from saucerbot.handlers import HandlerRegistry
+
+    registry = HandlerRegistry()
+
+    @registry.handler(r"foo", platforms=["groupme"])
+    def foo(context):
+        context.post("foo")
+
+    @registry.handler(r"bar")
+    def bar(context):
+        context.post("bar")
+
+    @registry.handler(r"baz")
+    def baz(context):
+        context.post("baz")
+
+    plan = registry.dispatch_plan("discord", frozenset({"foo", "bar"}))
+    assert [h.name for h in plan.handlers] == ["bar"]
+    assert registry.dispatch_plan("discord", frozenset({"foo", "bar"})) is plan
+
+    # Regex on a disabled handler doesn't make the enabled ones candidates
+    assert plan.regex_index.candidates("baz") == set()
+
+
+def test_filter_and_get():
+    from saucerbot.handlers import HandlerRegistry
+
+    registry = HandlerRegistry()
+
+    @registry.handler(r"foo", platforms=["groupme"])
+    def foo(context):
+        context.post("foo")
+
+    @registry.handler(r"bar", on_by_default=True)
+    def bar(context):
+        context.post("bar")
+
+    assert registry.get(name="foo").func is foo
+    assert registry.get(name="missing") is None
+    assert registry.get(on_by_default=True).func is bar
+
+    discord = registry.filter("discord")
+    assert [h.name for h in discord] == ["bar"]
+    assert discord.get(name="foo") is None
+    assert registry.filter("discord") is discord
+
+
+@pytest.mark.asyncio
+async def test_handle_message_async():
+    from saucerbot.handlers import HandlerRegistry
+
+    registry = HandlerRegistry()
+    threads = {}
+
+    @registry.handler(r"foo")
+    async def foo(context, message):
+        threads["foo"] = threading.current_thread()
+        context.post("foo " + message.content)
+
+    @registry.handler(r"bar")
+    def bar(context):
+        threads["bar"] = threading.current_thread()
+        context.post("bar")
+
+    @registry.handler(always_run=True)
+    async def always(context, message):
+        context.post("always")
+        return True
+
+    names = {"foo", "bar", "always"}
+
+    context = get_test_context()
+    matched = await registry.handle_message_async(
+        "discord", names, context, get_test_message("foo")
+    )
+    assert matched == ["foo", "always"]
+    assert context.posts == ["foo foo", "always"]
+
+    context = get_test_context()
+    matched = await registry.handle_message_async(
+        "discord", names, context, get_test_message("bar")
+    )
+    assert matched == ["bar", "always"]
+    assert context.posts == ["bar", "always"]
+
+    # async handlers run on the loop, sync ones get offloaded
+    assert threads["foo"] is threading.current_thread()
+    assert threads["bar"] is not threading.current_thread()
+
+
+def test_async_handler_from_sync():
+    from saucerbot.handlers import HandlerRegistry
+
+    registry = HandlerRegistry()
+
+    @registry.handler(r"foo")
+    async def foo(context, match):
+        context.post(match.group(0))
+
+    assert registry.get(name="foo").is_coroutine
+
+    context = get_test_context()
+    matched = registry.handle_message(
+        "groupme", {"foo"}, context, get_test_message("FOO")
+    )
+    assert matched == ["foo"]
+    assert context.posts == ["FOO"]
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+import runpy
+
+import pytest
+
+
+def load_base_settings(monkeypatch, **env: str) -> dict:
+    """
+    Evaluate the base settings again, with the given environment
+    """
+    for name in ("CACHE_URL", "SPORTS_CACHE", "HANDLER_SET_CACHE"):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+    return runpy.run_path("saucerbot/settings/base.py")
+
+
+def test_no_shared_cache(monkeypatch):
+    settings = load_base_settings(monkeypatch)
+
+    assert "shared" not in settings["CACHES"]
+    assert settings["SPORTS_CACHE"] == "default"
+    # Handler sets don't get cached per-process, they'd go stale in other workers
+    assert settings["HANDLER_SET_CACHE"] is None
+
+
+@pytest.mark.parametrize(
+    "cache_url,backend",
+    [
+        ("db", "django.core.cache.backends.db.DatabaseCache"),
+        ("redis://cache:6379/0", "django.core.cache.backends.redis.RedisCache"),
+    ],
+)
+def test_shared_cache(monkeypatch, cache_url, backend):
+    settings = load_base_settings(monkeypatch, CACHE_URL=cache_url)
+
+    assert settings["CACHES"]["shared"]["BACKEND"] == backend
+    assert settings["SPORTS_CACHE"] == "shared"
+    assert settings["HANDLER_SET_CACHE"] == "shared"
+
+
+def test_caches_overridden(monkeypatch):
+    settings = load_base_settings(
+        monkeypatch, CACHE_URL="db", SPORTS_CACHE="default", HANDLER_SET_CACHE="other"
+    )
+
+    assert settings["SPORTS_CACHE"] == "default"
+    assert settings["HANDLER_SET_CACHE"] == "other"
@@ -5,10 +5,13 @@ from datetime import datetime
 import arrow
 import pytest
 
+from saucerbot.utils.sports.models import ScheduleEvent
 from saucerbot.utils.sports.schedule_page_utils import (
+    SeasonSchedule,
     find_most_recent_event,
     read_schedule_events,
 )
+from tests.factories import make_scoreboard_event
 
 simple_events = [
     {
@@ -109,16 +112,13 @@ def sample_events():
     results = [True, True, True, False]
 
     def make_event(date, opponent, result):
-        return {
-            "date": date.date(),
-            "opponent": {"displayName": opponent},
-            "result": {
-                "isWinner": result,
-                "currentTeamScore": 50,
-                "opponentTeamScore": 40 + (0 if result else 20),
-            },
-            "status": {"completed": True},
-        }
+        return ScheduleEvent(
+            date=date.date(),
+            opponent=opponent,
+            vandy_score=50,
+            opponent_score=40 + (0 if result else 20),
+            completed=True,
+        )
 
     return [
         make_event(dates_for_events[i], opponents[i], results[i])
@@ -130,20 +130,22 @@ def test_read_simple_events(simple_events_page):
     events = read_schedule_events(simple_events_page)
     assert len(events) == 1
 
-    assert events[0]["date"] == datetime(2024, 11, 14).date()
-    assert "opponent" in events[0]
-    assert "result" in events[0]
-    assert "status" in events[0]
+    assert events[0] == ScheduleEvent(
+        date=datetime(2024, 11, 14).date(),
+        opponent="California Golden Bears",
+        vandy_score=85,
+        opponent_score=69,
+        completed=True,
+    )
 
 
 def test_weird_time_events(events_with_weird_times_page):
     events = read_schedule_events(events_with_weird_times_page)
     assert len(events) == 1
 
-    assert events[0]["date"] == datetime(2024, 12, 24).date()
-    assert "opponent" in events[0]
-    assert "result" in events[0]
-    assert "status" in events[0]
+    assert events[0].date == datetime(2024, 12, 24).date()
+    assert events[0].opponent == "California Golden Bears"
+    assert events[0].completed
 
 
 def test_sample_event_page():
@@ -162,12 +164,28 @@ def test_sample_event_page():
         datetime(2025, 2, 19),  # 00:00Z
     ]
 
-    actual_dates = sorted([event["date"] for event in events])
+    actual_dates = sorted([event.date for event in events])
     expected_dates = sorted([event.date() for event in expected_dates])
 
     assert actual_dates == expected_dates
 
 
+def test_team_schedule_matches_full_page():
+    from saucerbot.utils.sports import schedule_page_utils
+
+    with open("test_resources/sample_schedule_page.html", "rb") as infile:
+        html = infile.read()
+
+    # Only decoding the team schedule gets the same thing as parsing the whole page
+    retrieve_team_schedule = getattr(schedule_page_utils, "__retrieve_team_schedule")
+    retrieve_page_json = getattr(schedule_page_utils, "__retrieve_basketball_json")
+
+    page_json = retrieve_page_json(html)
+    team_schedule = page_json["page"]["content"]["scheduleData"]["teamSchedule"]
+    assert retrieve_team_schedule(html) == team_schedule
+    assert len(read_schedule_events(html)) == 6
+
+
 @pytest.mark.parametrize(
     "desired_date,expected_result_date",
     [
@@ -181,7 +199,7 @@ def test_sample_event_page():
 def test_find_recent_event(sample_events, desired_date, expected_result_date):
     event = find_most_recent_event(sample_events, desired_date)
 
-    assert event["date"] == expected_result_date.date()
+    assert event.date == expected_result_date.date()
 
 
 def test_find_recent_event_from_unordered(sample_events):
@@ -190,7 +208,7 @@ def test_find_recent_event_from_unordered(sample_events):
     random.shuffle(sample_events)
     event = find_most_recent_event(sample_events, desired_date)
 
-    assert event["date"] == datetime(2024, 1, 1).date()
+    assert event.date == datetime(2024, 1, 1).date()
 
 
 def test_find_recent_event_none_before(sample_events):
@@ -199,3 +217,252 @@ def test_find_recent_event_none_before(sample_events):
     event = find_most_recent_event(sample_events, desired_date)
 
     assert event is None
+
+
+def test_season_schedule(sample_events):
+    random.shuffle(sample_events)
+    schedule = SeasonSchedule.from_events(sample_events)
+
+    assert list(schedule.dates) == sorted(schedule.dates)
+    assert schedule.latest_on_or_before(datetime(2023, 1, 1).date()) is None
+    assert schedule.latest_on_or_before(datetime(2024, 6, 1).date()).date == (
+        datetime(2024, 6, 1).date()
+    )
+    assert schedule.next_after(datetime(2024, 6, 1).date()).date == (
+        datetime(2024, 6, 2).date()
+    )
+    assert schedule.next_after(datetime(2024, 6, 2).date()) is None
+
+
+def test_schedule_ttl(sample_events):
+    from saucerbot.utils.sports import cache as sports_cache
+    from saucerbot.utils.sports.schedule_page_utils import schedule_ttl
+
+    def ttl():
+        return schedule_ttl(SeasonSchedule.from_events(sample_events))
+
+    assert ttl() == sports_cache.FINAL_TTL
+
+    sample_events.append(
+        sample_events[0]._replace(
+            date=arrow.now().shift(days=+3).date(), completed=False
+        )
+    )
+    assert ttl() == sports_cache.UPCOMING_TTL
+
+    sample_events.append(
+        sample_events[0]._replace(
+            date=arrow.now().shift(days=-1).date(), completed=False
+        )
+    )
+    assert ttl() == sports_cache.LIVE_TTL
+
+
+def test_schedule_cache_stale_while_revalidate(monkeypatch):
+    from saucerbot.utils.sports import cache as sports_cache
+
+    url = "https://example.com/schedule"
+    fetched = []
+    refreshed = []
+
+    def fetch():
+        fetched.append(url)
+        return len(fetched)
+
+    class FakeRefresher:
+        def submit(self, func, *args):
+            refreshed.append(args)
+            func(*args)
+            return True
+
+    monkeypatch.setattr(sports_cache, "refresher", FakeRefresher())
+    sports_cache.clear(url)
+
+    assert sports_cache.get_or_fetch(url, fetch, lambda _: 60) == 1
+    assert sports_cache.get_or_fetch(url, fetch, lambda _: 60) == 1
+    assert len(fetched) == 1
+
+    # Expired, so the old one is handed back while it gets refreshed
+    sports_cache.clear(url)
+    assert sports_cache.get_or_fetch(url, fetch, lambda _: -1) == 2
+    assert sports_cache.get_or_fetch(url, fetch, lambda _: 60) == 2
+    assert len(refreshed) == 1
+    assert sports_cache.get_or_fetch(url, fetch, lambda _: 60) == 3
+
+    sports_cache.clear(url)
+
+
+def test_schedule_cache_shared_between_workers(db, settings):
+    from django.core.cache import CacheHandler
+    from django.core.management import call_command
+
+    from saucerbot.utils.sports import cache as sports_cache
+
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "shared": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "saucerbot_cache",
+        },
+    }
+    settings.SPORTS_CACHE = "shared"
+    call_command("createcachetable", "--database", "default")
+
+    url = "https://example.com/shared-schedule"
+    assert sports_cache.get_or_fetch(url, lambda: "fetched", lambda _: 60) == "fetched"
+
+    # Another worker has its own cache connections, but sees the same entry
+    other_worker = CacheHandler(settings.CACHES)
+    cached = other_worker["shared"].get(f"espn:{url}")
+    assert cached.value == "fetched"
+
+
+def make_football_event(date, opponent, vandy_score, opponent_score, completed):
+    return {
+        "date": date,
+        "competitions": [
+            {
+                "competitors": [
+                    {
+                        "id": "238",
+                        "team": {"displayName": "Vanderbilt Commodores"},
+                        "score": {"value": vandy_score, "displayValue": "0"},
+                    },
+                    {
+                        "id": "2",
+                        "team": {"displayName": opponent},
+                        "score": {"value": opponent_score, "displayValue": "0"},
+                    },
+                ],
+                "status": {"type": {"completed": completed}},
+            }
+        ],
+    }
+
+
+football_schedule = {
+    "events": [
+        make_football_event("2024-10-06T00:00Z", "Alabama", 40.0, 35.0, True),
+        make_football_event("2024-08-31T16:00Z", "Virginia Tech", 34.0, 27.0, True),
+        make_football_event("2024-10-19T16:00Z", "Texas", 0.0, 0.0, False),
+    ]
+}
+
+
+def test_read_football_schedule():
+    from saucerbot.utils.sports.football import read_football_schedule
+
+    schedule = read_football_schedule(football_schedule)
+
+    assert [event.opponent for event in schedule.events] == [
+        "Virginia Tech",
+        "Alabama",
+        "Texas",
+    ]
+    # evening game in central time
+    assert schedule.events[1].date == datetime(2024, 10, 5).date()
+    assert schedule.events[1].vandy_score == 40
+    assert schedule.events[1].opponent_score == 35
+    assert schedule.events[1].completed
+
+
+def test_football_schedule_fetched_once(monkeypatch):
+    from saucerbot.utils.sports import cache as sports_cache
+    from saucerbot.utils.sports.football import VandyFootball
+
+    requested = []
+
+    class FakeResponse:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return football_schedule
+
+    def fake_get(url, **kwargs):
+        requested.append(url)
+        return FakeResponse()
+
+    monkeypatch.setattr("saucerbot.utils.http.get", fake_get)
+    football = VandyFootball()
+
+    result = football.get_latest_result(arrow.Arrow(2024, 10, 7))
+    assert result.opponent == "Alabama"
+    assert result.is_win()
+
+    result = football.get_latest_result(arrow.Arrow(2024, 9, 2))
+    assert result.opponent == "Virginia Tech"
+
+    assert len(requested) == 1
+    assert "season=2024" in requested[0]
+
+    sports_cache.clear(requested[0])
+
+
+@pytest.mark.parametrize(
+    "desired_date,opponent,is_finished",
+    [
+        # The Thursday before the game, it's this week's game
+        (arrow.Arrow(2024, 10, 17, tzinfo="US/Central"), "Texas", False),
+        (arrow.Arrow(2024, 10, 19, tzinfo="US/Central"), "Texas", False),
+        # The Sunday after, still the same week
+        (arrow.Arrow(2024, 10, 6, tzinfo="US/Central"), "Alabama", True),
+        # A bye week, so it's the last game (which is too old to report)
+        (arrow.Arrow(2024, 10, 14, tzinfo="US/Central"), "Alabama", True),
+        # The bowl game, in the weeks before it too
+        (arrow.Arrow(2024, 12, 15, tzinfo="US/Central"), "Georgia", False),
+        (arrow.Arrow(2025, 1, 2, tzinfo="US/Central"), "Georgia", False),
+    ],
+)
+def test_football_schedule_this_weeks_game(
+    monkeypatch, desired_date, opponent, is_finished
+):
+    from saucerbot.utils.sports import cache as sports_cache
+    from saucerbot.utils.sports.football import VandyFootball
+
+    requested = []
+    bowl_schedule = {
+        "events": [make_football_event("2024-12-28T20:00Z", "Georgia", 0, 0, False)]
+    }
+
+    class FakeResponse:
+        def __init__(self, url):
+            self.url = url
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return bowl_schedule if "seasontype=3" in self.url else football_schedule
+
+    def fake_get(url, **kwargs):
+        requested.append(url)
+        return FakeResponse(url)
+
+    monkeypatch.setattr("saucerbot.utils.http.get", fake_get)
+
+    result = VandyFootball().get_latest_result(desired_date)
+    assert result.opponent == opponent
+    assert result.is_finished == is_finished
+
+    for url in requested:
+        sports_cache.clear(url)
+
+
+def test_find_team_event():
+    from saucerbot.utils.sports.espn import find_team_event
+
+    scoreboard = {
+        "events": [
+            make_scoreboard_event(1, "Georgia", "Auburn"),
+            make_scoreboard_event(2, "Vanderbilt", "Alabama"),
+            # not valid, but we shouldn't even look at it
+            {"id": "nope"},
+        ]
+    }
+
+    event = find_team_event(scoreboard, "Vanderbilt")
+    assert event.id == 2
+    assert event.competitions[0].competitors[1].team.location == "Alabama"
+
+    assert find_team_event(scoreboard, "Tennessee") is None
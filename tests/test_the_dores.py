@@ -1,4 +1,4 @@
-from unittest.mock import Mock
+from unittest.mock import DEFAULT, Mock
 
 import arrow
 import pytest
@@ -440,3 +440,56 @@ def test_the_whole_thing_no_message(mocked_teams, message, desired_date, result_
 def test_the_whole_thing_no_message_match(mock_teams_no_message_match):
     actual_value = did_the_dores_win("Message provided", arrow.get("2021-01-03"))
     assert actual_value == "loss_inter Vandy loss"
+
+
+def test_results_fetched_concurrently(mocked_teams):
+    import threading
+
+    from saucerbot.utils.sports.models import get_latest_results
+
+    # All of them have to be running at once to get past this
+    barrier = threading.Barrier(len(mocked_teams), timeout=5)
+
+    def wait_for_everyone(*args):
+        barrier.wait()
+        return DEFAULT
+
+    for team in mocked_teams:
+        team.get_latest_result.side_effect = wait_for_everyone
+
+    results = get_latest_results(mocked_teams, arrow.get("2021-01-03"))
+    assert [r.vandy_team if r else None for r in results] == ["Team1", "Team2", None]
+
+
+def test_slow_team_skipped(mocked_teams):
+    import threading
+
+    from saucerbot.utils.sports.models import get_latest_results
+
+    done = threading.Event()
+    mocked_teams[0].get_latest_result.side_effect = lambda _: done.wait(5)
+    mocked_teams[2].get_latest_result.side_effect = Exception("ESPN is down")
+
+    results = get_latest_results(mocked_teams, arrow.get("2021-01-03"), timeout=0.1)
+    done.set()
+
+    assert results[0] is None
+    assert results[1].vandy_team == "Team2"
+    assert results[2] is None
+
+
+def test_results_from_db(mocked_teams, db, settings):
+    from saucerbot.core.models import GameResult
+
+    settings.GAME_RESULTS_FROM_DB = True
+
+    for team in mocked_teams:
+        result = team.get_latest_result.return_value
+        if result:
+            GameResult.objects.record(team.name, result)
+
+    assert did_the_dores_win(None, arrow.get("2021-01-03")) == "win_inter Vandy win"
+    assert did_the_dores_win(None, arrow.get("2021-01-10")) is None
+
+    for team in mocked_teams:
+        team.get_latest_result.assert_not_called()